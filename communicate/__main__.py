@@ -0,0 +1,3 @@
+from communicate.entry import main
+
+main()
@@ -0,0 +1,195 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, TextIO
+
+from communicate.cli import CLI, CLI_DONE, CLI_NEXT
+from communicate.communicator import Communicator
+from communicate.constants import BLANK, EMPTY
+from communicate.letter_choice import LetterChoice
+from communicate.make_grid import make_grid
+from communicate.trace import percentile
+
+# BATCH VALUES
+TARGET_PREFIX: str = "="
+COMMENT_PREFIX: str = "#"
+
+
+def prepare_grid(comms: Communicator, word: str, letter_choice: LetterChoice) -> None:
+    """Evaluate word and clear grid for Grid method, lay out pages for Point, else reduce it,
+    like GUI and CLI do after each letter."""
+    comms.eval_grid(word)
+    if letter_choice == LetterChoice.GRID:
+        comms.clear_grid()
+    elif letter_choice == LetterChoice.POINT:
+        comms.page_grid()
+    else:
+        comms.reduce_grid()
+
+
+def locate_item(
+    comms: Communicator, text: str, letter_choice: LetterChoice
+) -> Optional[tuple[str, tuple[int, int]]]:
+    """Longest letter or chunk on current grid that text starts with, and row and column a user picks for it,
+    None if no cell starts text. Grid picks grid column, GridPoint and Point pick index within row without empty spaces,
+    Point row is page number."""
+    found: Optional[tuple[str, tuple[int, int]]] = None
+    for row_num in range(len(comms.remain_grid)):
+        row = (
+            comms.choose_grid_row(row_num)
+            if letter_choice == LetterChoice.GRID
+            else comms.choose_grid_row_reduce(row_num)
+        )
+        for col_num, item in enumerate(row):
+            if item != EMPTY and text.startswith(item):
+                if found is None or len(item) > len(found[0]):
+                    found = item, (row_num, col_num)
+    return found
+
+
+def cli_inputs(
+    comms: Communicator, location: tuple[int, int], letter_choice: LetterChoice
+) -> list[str]:
+    """Inputs CLI prompts for to pick letter at location, Point answers next for each earlier page."""
+    row, col = location
+    if letter_choice == LetterChoice.POINT:
+        return [CLI_NEXT] * row + [str(col + 1)]
+    if letter_choice == LetterChoice.GRID_POINT and comms.num_rows == 1:
+        return [str(col + 1)]
+    return [str(row + 1), str(col + 1)]
+
+
+def target_inputs(
+    cli: CLI, target: str, letter_choice: LetterChoice
+) -> Iterator[str]:
+    """Inputs that type target word through CLI, then done. Each letter or chunk is located only when CLI prompts for it,
+    so it is found on grid as it is then. Stops with done if rest of word can't be picked."""
+    typed = BLANK
+    while len(typed) < len(target):
+        found = locate_item(cli.comms, target[len(typed) :], letter_choice)
+        if found is None:
+            break
+        item, location = found
+        yield from cli_inputs(cli.comms, location, letter_choice)
+        typed += item
+    yield CLI_DONE
+
+
+def reader(answers: Iterator[str], counter: list[int]) -> Callable[[str], str]:
+    """Prompt answerer giving next answer and counting it, EOFError like input once answers run out."""
+
+    def read(_prompt: str) -> str:
+        answer = next(answers, None)
+        if answer is None:
+            raise EOFError("Out of selections")
+        counter[0] += 1
+        return answer
+
+    return read
+
+
+def discard(*_args) -> None:
+    """Write nothing, batch results are reported instead of prompts."""
+
+
+def run_session(comms: Communicator, line: str) -> dict:
+    """Play one script line through CLI, line is method then either selections as typed at prompts, or target word
+    after prefix. Returns word typed, final word if done, selections read, milliseconds of each step and invalid selections."""
+    method, *tokens = line.split()
+    comms.reset_grid()
+    cli = CLI(comms=comms, read=reader(iter([method]), [0]), write=discard)
+    try:
+        cli.letter_choice = cli._choose_method()
+    except EOFError:
+        return {"method": method, "error": f"Unknown method {method}"}
+    counter = [0]
+    if len(tokens) == 1 and tokens[0].startswith(TARGET_PREFIX):
+        answers = target_inputs(cli, tokens[0][len(TARGET_PREFIX) :], cli.letter_choice)
+    else:
+        answers = iter(tokens)
+    cli.read = reader(answers, counter)
+    word = BLANK
+    steps: list[float] = []
+    errors: list[str] = []
+    incomplete = True
+    while incomplete and not comms.done:
+        start = time.perf_counter()
+        try:
+            incomplete, word = cli.play_step(word)
+        except ValueError as e:
+            errors.append(str(e).strip())
+            continue
+        except EOFError:
+            break
+        steps.append(time.perf_counter() - start)
+    return {
+        "method": method,
+        "word": word,
+        "done": comms.done,
+        "final": comms.suggestions[0] if comms.done and comms.suggestions else word,
+        "selections": counter[0],
+        "steps_ms": [step * 1000 for step in steps],
+        "errors": errors,
+    }
+
+
+def script_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Lines of script that are sessions, skipping blank and comment lines."""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith(COMMENT_PREFIX):
+            yield line
+
+
+def run_batch(comms: Communicator, lines: Iterable[str], output: TextIO) -> dict:
+    """Play each session of script, writing each result as JSON line as soon as it is done.
+    Returns totals of sessions, finished words, selections and step latency."""
+    sessions = finished = selections = 0
+    steps: list[float] = []
+    for line in script_lines(lines):
+        result = run_session(comms, line)
+        output.write(json.dumps(result) + "\n")
+        sessions += 1
+        finished += result.get("done", False)
+        selections += result.get("selections", 0)
+        steps += result.get("steps_ms", [])
+    return {
+        "sessions": sessions,
+        "done": finished,
+        "selections": selections,
+        "steps": len(steps),
+        "p50_ms": percentile(steps, 50),
+        "p99_ms": percentile(steps, 99),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Replay script of CLI sessions from file or stdin without prompts, printing JSON line per session."""
+    parser = argparse.ArgumentParser(
+        description="Replay CLI sessions without prompts",
+        epilog="Each line is a method (clear, reduce, point) then selections as typed at its prompts, "
+        f"like 'reduce 1 3 2 2 d', or a word to type after {TARGET_PREFIX}, like 'point {TARGET_PREFIX}hello'.",
+    )
+    parser.add_argument("script", type=Path, nargs="?", help="script file, stdin if not given")
+    parser.add_argument("--custom", action="store_true", help="turn smart mode off")
+    parser.add_argument("--summary", action="store_true", help="end with JSON line of totals")
+    parser.add_argument(
+        "--chunks", action="store_true", help="fill empty cells with likely letter chunks"
+    )
+    args = parser.parse_args(argv)
+    comms = Communicator(
+        start_grid=make_grid(), smart=not args.custom, chunks=args.chunks
+    )
+    if args.script is None:
+        summary = run_batch(comms, sys.stdin, sys.stdout)
+    else:
+        with args.script.open() as script:
+            summary = run_batch(comms, script, sys.stdout)
+    if args.summary:
+        print(json.dumps({"summary": summary}))
+
+
+if __name__ == "__main__":
+    main()
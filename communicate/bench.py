@@ -0,0 +1,314 @@
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from communicate.batch import cli_inputs, discard, locate_item, prepare_grid
+from communicate.cli import CLI
+from communicate.communicator import Communicator
+from communicate.constants import (
+    ALPHABET,
+    BLANK,
+    GRID_PROMPT,
+    GRIDPOINT_PROMPT,
+    MAX_COLS,
+    MAX_ROWS,
+)
+from communicate.letter_choice import LetterChoice
+from communicate.make_grid import make_grid
+from communicate.scan import scan_groups, scan_steps
+from communicate.trace import CHROME_FORMAT, STATS_FORMAT, TRACER, percentile
+
+# BENCH VALUES
+NUM_WORDS: int = 200
+CLI_METHODS: list[LetterChoice] = [
+    LetterChoice.GRID,
+    LetterChoice.GRID_POINT,
+    LetterChoice.POINT,
+]
+GUI_PROMPTS: dict[LetterChoice, str] = {
+    LetterChoice.GRID: GRID_PROMPT,
+    LetterChoice.GRID_POINT: GRIDPOINT_PROMPT,
+}
+STARTUP_CODE: str = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "from communicate.communicator import Communicator\n"
+    "from communicate.make_grid import make_grid\n"
+    "Communicator(start_grid=make_grid(), smart=True)\n"
+    "print(time.perf_counter() - start)\n"
+)
+IMPORT_BUDGET_MS: float = 150.0
+IMPORT_FORBIDDEN: list[str] = ["tkinter", "numpy", "nltk"]
+IMPORT_CODE: str = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import communicate.entry, communicate.cli\n"
+    "print((time.perf_counter() - start) * 1000)\n"
+    f"print(','.join(name for name in {IMPORT_FORBIDDEN!r} if name in sys.modules))\n"
+)
+
+
+def selection_count(
+    comms: Communicator, row: int, letter_choice: LetterChoice
+) -> int:
+    """Number of selections to pick letter at row. Grid picks row and column, GridPoint skips row if only one,
+    Point flips past each earlier page then picks letter."""
+    if letter_choice == LetterChoice.GRID:
+        return 2
+    if letter_choice == LetterChoice.GRID_POINT:
+        return 2 if comms.num_rows > 1 else 1
+    return row + 1
+
+
+def replay_word(
+    comms: Communicator, word: str, letter_choice: LetterChoice
+) -> tuple[str, int, list[float]]:
+    """Pick letters of word with Communicator one at a time until word typed or only one word left,
+    picking longest chunk of rest of word if grid has one.
+
+    Returns word typed so far, number of selections made and seconds each keystroke took to evaluate.
+    Scan selections are highlights waited through, scanning in order of next letter probability.
+    Stops early if rest of word can't be picked from grid.
+    """
+    typed = BLANK
+    selections = 0
+    timings: list[float] = []
+    prepare_grid(comms, typed, letter_choice)
+    while len(typed) < len(word):
+        found = locate_item(comms, word[len(typed) :], letter_choice)
+        if found is None:
+            break
+        item, location = found
+        selections += (
+            scan_steps(scan_groups(comms.remain_grid, comms.ranked_letters()), item)
+            if letter_choice == LetterChoice.SCAN
+            else selection_count(comms, location[0], letter_choice)
+        )
+        start = time.perf_counter()
+        typed += item
+        prepare_grid(comms, typed, letter_choice)
+        timings.append(time.perf_counter() - start)
+        if comms.done:
+            break
+    return typed, selections, timings
+
+
+def replay_cli_word(
+    comms: Communicator, word: str, letter_choice: LetterChoice
+) -> list[float]:
+    """Pick letters of word through CLI play step with answers fed to its prompts and output discarded.
+    Returns seconds each keystroke took."""
+    cli = CLI(comms=comms, write=discard)
+    cli.letter_choice = letter_choice
+    typed = BLANK
+    timings: list[float] = []
+    prepare_grid(comms, typed, letter_choice)
+    while len(typed) < len(word):
+        found = locate_item(comms, word[len(typed) :], letter_choice)
+        if found is None:
+            break
+        answers = iter(cli_inputs(comms, found[1], letter_choice))
+        cli.read = lambda _: next(answers)
+        start = time.perf_counter()
+        _, typed = cli.play_step(typed)
+        timings.append(time.perf_counter() - start)
+        if comms.done:
+            break
+    return timings
+
+
+def replay_gui_words(
+    comms: Communicator, words: list[str], letter_choice: LetterChoice
+) -> list[float]:
+    """Pick letters of words with GUI letter callback, waiting for its background evaluation and flushing Tk redraw
+    after each one so both are timed too. Needs display, run under virtual display like xvfb-run when headless.
+    Returns seconds each keystroke took."""
+    from communicate.gui import GUI
+
+    gui = GUI(comms=comms)
+    gui._choose_method(GUI_PROMPTS[letter_choice].lower())
+    gui._flush()
+    gui.update()
+    timings: list[float] = []
+    for word in words:
+        for letter in word:
+            if letter not in comms.remain_letters:
+                break
+            start = time.perf_counter()
+            gui._pick_letter(letter)
+            gui._flush()
+            gui.update_idletasks()
+            timings.append(time.perf_counter() - start)
+            if gui.word == BLANK:
+                break
+        gui.word = BLANK
+        gui.sentence = BLANK
+        gui._execute()
+        gui._flush()
+    gui.destroy()
+    return timings
+
+
+def latency_stats(timings: list[float]) -> dict[str, float]:
+    """Keystroke count and p50/p99 latency in milliseconds."""
+    return {
+        "keystrokes": len(timings),
+        "p50_ms": percentile(timings, 50) * 1000,
+        "p99_ms": percentile(timings, 99) * 1000,
+    }
+
+
+def peak_rss_kb() -> int:
+    """Peak resident memory of this process in KB, macOS reports bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def measure_startup() -> float:
+    """Seconds to import and build Communicator in fresh interpreter, so nothing is already loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_CODE],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def measure_imports() -> dict:
+    """Milliseconds to import console entry point and CLI in fresh interpreter, and any heavy modules they pulled in."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_CODE],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_ms, forbidden = result.stdout.splitlines()[-2:]
+    return {
+        "import_ms": float(import_ms),
+        "budget_ms": IMPORT_BUDGET_MS,
+        "heavy_modules": forbidden.split(",") if forbidden else [],
+    }
+
+
+def check_imports(imports: dict) -> Optional[str]:
+    """Why cold start import is over budget or pulls in GUI, NumPy or nltk, None if fine."""
+    if imports["heavy_modules"]:
+        return f"CLI imports {', '.join(imports['heavy_modules'])}"
+    if imports["import_ms"] > imports["budget_ms"]:
+        return f"CLI import took {imports['import_ms']:.1f}ms, budget {imports['budget_ms']}ms"
+    return None
+
+
+def default_words(comms: Communicator, num_words: int = NUM_WORDS) -> list[str]:
+    """Most common words of lexicon."""
+    index = comms.prefix_index
+    return index.top_words(0, len(index.words), num_words)
+
+
+def run_bench(
+    words: list[str], smart: bool = True, gui: bool = False, chunks: bool = False
+) -> dict:
+    """Replay words through Communicator for each method and CLI for its methods, and GUI if asked, reporting latency, grid cache hits, memory and startup.
+    Startup of a second Communicator is reported too, it should only cost its own states since lexicon is shared.
+    If chunks, empty cells hold likely letter chunks and replays pick them."""
+    report: dict = {
+        "startup_s": measure_startup(),
+        "imports": measure_imports(),
+        "words": len(words),
+    }
+    comms = Communicator(
+        start_grid=make_grid(MAX_ROWS, MAX_COLS, ALPHABET), smart=smart, chunks=chunks
+    )
+    start = time.perf_counter()
+    Communicator(start_grid=make_grid(MAX_ROWS, MAX_COLS, ALPHABET), smart=smart)
+    report["second_communicator_ms"] = (time.perf_counter() - start) * 1000
+    report["communicator"] = {}
+    report["cli"] = {}
+    for letter_choice in LetterChoice:
+        timings: list[float] = []
+        selections = 0
+        for word in words:
+            _, word_selections, word_timings = replay_word(comms, word, letter_choice)
+            selections += word_selections
+            timings += word_timings
+        report["communicator"][letter_choice.name] = {
+            **latency_stats(timings),
+            "selections": selections,
+        }
+        if letter_choice not in CLI_METHODS:
+            continue
+        timings = []
+        for word in words:
+            timings += replay_cli_word(comms, word, letter_choice)
+        report["cli"][letter_choice.name] = latency_stats(timings)
+    if gui:
+        report["gui"] = {
+            letter_choice.name: latency_stats(
+                replay_gui_words(comms, words, letter_choice)
+            )
+            for letter_choice in GUI_PROMPTS
+        }
+    report["grid_cache"] = {
+        "hits": comms.grid_cache.hits,
+        "misses": comms.grid_cache.misses,
+    }
+    report["peak_rss_kb"] = peak_rss_kb()
+    return report
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run benchmark from command line, printing JSON report."""
+    parser = argparse.ArgumentParser(description="Replay words and time keystrokes")
+    parser.add_argument("--words", type=Path, help="file of words, one per line")
+    parser.add_argument("--num-words", type=int, default=NUM_WORDS)
+    parser.add_argument("--custom", action="store_true", help="turn smart mode off")
+    parser.add_argument("--gui", action="store_true", help="also replay through GUI")
+    parser.add_argument(
+        "--chunks", action="store_true", help="fill empty cells with likely letter chunks"
+    )
+    parser.add_argument("--output", type=Path, help="write report to file")
+    parser.add_argument("--trace", type=Path, help="time each stage, writing trace to file")
+    parser.add_argument(
+        "--trace-format", choices=[STATS_FORMAT, CHROME_FORMAT], default=STATS_FORMAT
+    )
+    parser.add_argument(
+        "--check-imports",
+        action="store_true",
+        help="only check CLI cold import against budget, failing if over",
+    )
+    args = parser.parse_args(argv)
+    if args.check_imports:
+        imports = measure_imports()
+        print(json.dumps(imports, indent=2))
+        problem = check_imports(imports)
+        if problem:
+            sys.exit(problem)
+        return
+    TRACER.enabled = TRACER.enabled or args.trace is not None
+    if args.words:
+        words = [
+            line.strip().lower()
+            for line in args.words.read_text().splitlines()
+            if line.strip()
+        ]
+    else:
+        comms = Communicator(start_grid=make_grid(), smart=True)
+        words = default_words(comms, args.num_words)
+    results = run_bench(words, not args.custom, args.gui, args.chunks)
+    if args.trace:
+        results["stages"] = TRACER.stats()
+        TRACER.export(args.trace, args.trace_format)
+    report = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+import argparse
+import heapq
+import os
+import re
+import struct
+import tempfile
+from collections import Counter
+from dataclasses import dataclass
+from itertools import groupby
+from multiprocessing import Pool
+from operator import itemgetter
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from communicate.constants import (
+    ALPHABET,
+    LEXICON_PATH,
+    NGRAM_MIN_COUNT,
+    NGRAM_ORDER,
+    NGRAM_PATH,
+)
+from communicate.lexicon import write_lexicon
+from communicate.ngram import write_ngrams
+
+# BUILD VALUES
+CORPORA: list[str] = ["words", "abc", "webtext"]
+NGRAM_CORPORA: list[str] = ["abc", "webtext"]
+TEXT_SUFFIXES: list[str] = [".txt"]
+TEXT_CHUNK_SIZE: int = 1 << 20
+TOKEN_PATTERN: re.Pattern = re.compile(r"[a-z]+|[^a-z\s]")
+NGRAM_SPILL_SIZE: int = 1 << 22
+RUN_READ_RECORDS: int = 1 << 14
+
+# word ids of lexicon set in each ngram worker process
+_word_ids: dict[str, int] = {}
+
+
+@dataclass(frozen=True)
+class Shard:
+    """Piece of corpus counted by one worker, a file of an nltk corpus or a byte range of a local text file.
+
+    Text file ranges own every line starting inside them, so splitting a big file never splits a line.
+    """
+
+    name: str
+    corpus: Optional[str] = None
+    start: int = 0
+    end: int = 0
+
+    def sentences(self) -> Iterator[list[str]]:
+        """Yield each sentence as lowercased tokens one at a time, every line is a sentence of a text file."""
+        if self.corpus is not None:
+            for sentence in nltk_corpus(self.corpus).sents(self.name):
+                yield [word.lower() for word in sentence]
+            return
+        with open(self.name, "rb") as text_file:
+            if self.start:
+                text_file.seek(self.start - 1)
+                text_file.readline()
+            while text_file.tell() < self.end:
+                line = text_file.readline()
+                if not line:
+                    break
+                yield TOKEN_PATTERN.findall(line.decode("utf-8", "ignore").lower())
+
+    def words(self) -> Iterator[str]:
+        """Yield every token lowercased one at a time."""
+        if self.corpus is not None:
+            for word in nltk_corpus(self.corpus).words(self.name):
+                yield word.lower()
+            return
+        for sentence in self.sentences():
+            yield from sentence
+
+
+def nltk_corpus(corpus_name: str):
+    """nltk corpus reader, nltk is only needed when building."""
+    from nltk import corpus as nltk_corpora  # type: ignore
+
+    return getattr(nltk_corpora, corpus_name)
+
+
+def corpus_shards(corpora: list[str]) -> list[Shard]:
+    """Download nltk corpora if needed and split them into one shard per corpus file.
+    No corpora needs no nltk, so local text can be built offline."""
+    if not corpora:
+        return []
+    import nltk  # type: ignore
+
+    shards = []
+    for corpus_name in corpora:
+        nltk.download(corpus_name, quiet=True)
+        shards += [
+            Shard(fileid, corpus_name)
+            for fileid in nltk_corpus(corpus_name).fileids()
+        ]
+    return shards
+
+
+def text_shards(paths: list[Path], chunk_size: int = TEXT_CHUNK_SIZE) -> list[Shard]:
+    """Split local text files into shards of about chunk size bytes, directories give all text files in them."""
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files += sorted(
+                sub_path
+                for sub_path in path.rglob("*")
+                if sub_path.suffix in TEXT_SUFFIXES
+            )
+        else:
+            files.append(path)
+    return [
+        Shard(str(file), start=start, end=min(start + chunk_size, file.stat().st_size))
+        for file in files
+        for start in range(0, file.stat().st_size, chunk_size)
+    ]
+
+
+def count_words(tokens: Iterable[str]) -> Counter:
+    """Count tokens, only keeping words made of letters of alphabet."""
+    alphabet = set(ALPHABET)
+    return Counter(token for token in tokens if set(token) <= alphabet)
+
+
+def count_ngrams(
+    sentences: Iterable[list[str]],
+    word_ids: dict[str, int],
+    order: int = NGRAM_ORDER,
+) -> list[Counter]:
+    """Count word id ngrams of length 2 up to order in sentences.
+    Tokens not in lexicon like punctuation break context, so ngrams never span them."""
+    ngram_counts: list[Counter] = [Counter() for _ in range(order - 1)]
+    for sentence in sentences:
+        run: list[int] = []
+        for token in sentence:
+            if token not in word_ids:
+                run = []
+                continue
+            run.append(word_ids[token])
+            for length in range(2, min(order, len(run)) + 1):
+                ngram_counts[length - 2][tuple(run[-length:])] += 1
+    return ngram_counts
+
+
+def shard_word_counts(shard: Shard) -> Counter:
+    """Word counts of one shard, run in worker process."""
+    return count_words(shard.words())
+
+
+def set_word_ids(word_ids: dict[str, int]) -> None:
+    """Give worker process word ids of lexicon once instead of with every shard."""
+    _word_ids.clear()
+    _word_ids.update(word_ids)
+
+
+def shard_ngram_counts(shard: Shard) -> list[Counter]:
+    """Ngram counts of one shard, run in worker process."""
+    return count_ngrams(shard.sentences(), _word_ids)
+
+
+def map_shards(
+    func: Callable,
+    shards: list[Shard],
+    jobs: int,
+    initializer: Optional[Callable] = None,
+    initargs: tuple = (),
+) -> Iterator:
+    """Yield func of each shard as workers finish them, in this process if only one job.
+    Workers stream their shard and only send back its counts, so no worker holds more than one shard."""
+    if jobs <= 1 or len(shards) <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from map(func, shards)
+        return
+    with Pool(min(jobs, len(shards)), initializer, initargs) as pool:
+        yield from pool.imap_unordered(func, shards)
+
+
+def build_frequency_map(shards: list[Shard], jobs: int) -> Counter:
+    """Merge word counts of all shards counted across jobs processes."""
+    frequency_map: Counter = Counter()
+    for counts in map_shards(shard_word_counts, shards, jobs):
+        frequency_map.update(counts)
+    return frequency_map
+
+
+def write_run(path: Path, counts: Counter, length: int) -> Path:
+    """Write ngram counts of one length sorted by ngram, each record its word ids then count as uint32."""
+    record = struct.Struct(f"<{length + 1}I")
+    with open(path, "wb") as run_file:
+        for ngram in sorted(counts):
+            run_file.write(record.pack(*ngram, counts[ngram]))
+    return path
+
+
+def read_run(path: Path, length: int) -> Iterator[tuple[tuple[int, ...], int]]:
+    """Yield ngrams and counts of run file in its sorted order, reading a block of records at a time."""
+    record = struct.Struct(f"<{length + 1}I")
+    with open(path, "rb") as run_file:
+        while block := run_file.read(record.size * RUN_READ_RECORDS):
+            for values in record.iter_unpack(block):
+                yield values[:-1], values[-1]
+
+
+def merge_runs(
+    runs: list[Iterator[tuple[tuple[int, ...], int]]], min_count: int
+) -> dict[tuple[int, ...], int]:
+    """Merge sorted runs summing counts of same ngram, keeping only ngrams seen at least min count."""
+    merged: dict[tuple[int, ...], int] = {}
+    for ngram, group in groupby(heapq.merge(*runs, key=itemgetter(0)), key=itemgetter(0)):
+        count = sum(count for _, count in group)
+        if count >= min_count:
+            merged[ngram] = count
+    return merged
+
+
+def build_ngrams(
+    frequency_map: dict[str, int],
+    path: Path = NGRAM_PATH,
+    shards: Optional[list[Shard]] = None,
+    jobs: int = 1,
+    min_count: int = NGRAM_MIN_COUNT,
+    spill_size: int = NGRAM_SPILL_SIZE,
+) -> Path:
+    """Compile sentence shards into ngram file of word ids of lexicon built from frequency map,
+    dropping ngrams seen less than min count once all shards are merged.
+
+    Shard counts are merged in memory until they hold spill size ngrams, then spilled to temporary run files
+    sorted by ngram. Runs are merged in one pass at the end, so memory is bounded by spill size and kept ngrams
+    rather than by every distinct ngram of the corpus."""
+    if shards is None:
+        shards = corpus_shards(NGRAM_CORPORA)
+    word_ids = {word: idx for idx, word in enumerate(sorted(frequency_map))}
+    lengths = range(2, NGRAM_ORDER + 1)
+    ngram_counts: list[Counter] = [Counter() for _ in lengths]
+    with tempfile.TemporaryDirectory() as run_dir:
+        run_paths: list[list[Path]] = [[] for _ in lengths]
+        for counts in map_shards(
+            shard_ngram_counts, shards, jobs, set_word_ids, (word_ids,)
+        ):
+            for merged, partial in zip(ngram_counts, counts):
+                merged.update(partial)
+            if sum(len(merged) for merged in ngram_counts) >= spill_size:
+                for length, merged, paths in zip(lengths, ngram_counts, run_paths):
+                    run_path = Path(run_dir) / f"{length}-{len(paths)}.run"
+                    paths.append(write_run(run_path, merged, length))
+                    merged.clear()
+        kept = [
+            merge_runs(
+                [read_run(run_path, length) for run_path in paths]
+                + [iter(sorted(merged.items()))],
+                min_count,
+            )
+            for length, merged, paths in zip(lengths, ngram_counts, run_paths)
+        ]
+    return write_ngrams(path, len(word_ids), kept)
+
+
+def build_lexicon(
+    path: Path = LEXICON_PATH,
+    ngram_path: Path = NGRAM_PATH,
+    texts: Optional[list[Path]] = None,
+    corpora: list[str] = CORPORA,
+    jobs: Optional[int] = None,
+) -> Path:
+    """Compile nltk corpora and local text files once into lexicon file and its ngram file that are loaded on use.
+    Shards are counted across jobs processes, all cores if not given."""
+    jobs = jobs or os.cpu_count() or 1
+    local_shards = text_shards(texts or [])
+    frequency_map = build_frequency_map(corpus_shards(corpora) + local_shards, jobs)
+    ngram_shards = (
+        corpus_shards([name for name in NGRAM_CORPORA if name in corpora])
+        + local_shards
+    )
+    build_ngrams(frequency_map, ngram_path, ngram_shards, jobs)
+    return write_lexicon(path, frequency_map)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Build lexicon file from command line."""
+    parser = argparse.ArgumentParser(description="Compile word corpora into lexicon")
+    parser.add_argument("--output", type=Path, default=LEXICON_PATH)
+    parser.add_argument("--ngram-output", type=Path, default=NGRAM_PATH)
+    parser.add_argument(
+        "--text",
+        type=Path,
+        nargs="+",
+        default=[],
+        help="local text files or directories of them to add",
+    )
+    parser.add_argument(
+        "--corpora", nargs="*", default=CORPORA, help="nltk corpora to include"
+    )
+    parser.add_argument("--jobs", type=int, help="worker processes, all cores if not given")
+    args = parser.parse_args(argv)
+    path = build_lexicon(
+        args.output, args.ngram_output, args.text, args.corpora, args.jobs
+    )
+    print(f"Wrote lexicon to {path} and ngrams to {args.ngram_output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Callable, Optional
 
 from communicate.communicator import Communicator
 from communicate.constants import (
     BLANK,
     GRID_PROMPT,
     GRIDPOINT_PROMPT,
-    MAX_SUGGESTIONS,
+    MAX_CHUNK_LENGTH,
     POINT_PROMPT,
 )
 from communicate.letter_choice import LetterChoice
+from communicate.make_grid import Grid
+from communicate.trace import traced
 
 # CLI VALUES
 CLI_DONE: str = "d"
@@ -17,33 +20,61 @@ CLI_NEXT: str = "n"
 
 @dataclass
 class CLI:
-    """Command line Interface UI. Has Communicator object to do letter selection, letter_choice for way to select."""
+    """Command line Interface UI. Has Communicator object to do letter selection, letter_choice for way to select.
+    Prompts are answered by read and output goes to write, terminal by default, so scripts can drive it instead."""
 
     comms: Communicator
+    shown_grid: Optional[Grid] = None
+    row_lines: list[str] = field(default_factory=list)
+    read: Callable[[str], str] = input
+    write: Callable[..., None] = print
 
     @property
-    def grid(self) -> list[list[str]]:
+    def grid(self) -> Grid:
         """Convenience method to get grid object itself directly."""
         return self.comms.remain_grid
 
+    @property
+    def cell_width(self) -> int:
+        """Characters each cell is padded to, so columns line up when cells hold chunks."""
+        return MAX_CHUNK_LENGTH if self.comms.chunks else 1
+
+    @traced("cli.display_grid")
     def display_grid(self) -> str:
-        """Display grid of letters and associated rows/columns to Command Line."""
+        """Display grid of letters and associated rows/columns to Command Line.
+        Rows are kept rendered, only rows changed since grid was last displayed are rendered again."""
+        diff = self.comms.render_diff(self.shown_grid)
+        if diff.resized:
+            self.row_lines = [BLANK for _ in self.grid]
+        for row_num in diff.rows:
+            row = self.grid[row_num]
+            self.row_lines[row_num] = (
+                f" {row_num+1} | "
+                + " | ".join(letter.upper().ljust(self.cell_width) for letter in row)
+                + "\n"
+            )
+        self.shown_grid = self.grid
         grid = (
             "   | "
-            + " | ".join(str(col + 1) for col in range(self.comms.num_cols))
+            + " | ".join(
+                str(col + 1).ljust(self.cell_width) for col in range(self.comms.num_cols)
+            )
             + "\n"
         )
-        for row_num, row in enumerate(self.grid):
-            grid += (
-                f" {row_num+1} | " + " | ".join(letter.upper() for letter in row) + "\n"
-            )
-        return grid
+        return grid + "".join(self.row_lines)
 
+    @traced("cli.display_row")
     def display_row(self, row: int) -> str:
         """Display row with letters and associated numbers to Command Line"""
         row_vals = self.comms.choose_grid_row_reduce(row)
-        row_str = " | ".join(str(col + 1) for col in range(len(row_vals))) + "\n"
-        row_str += " | ".join(letter.upper() for letter in row_vals) + "\n"
+        row_str = (
+            " | ".join(str(col + 1).ljust(self.cell_width) for col in range(len(row_vals)))
+            + "\n"
+        )
+        row_str += (
+            " | ".join(letter.upper().ljust(self.cell_width) for letter in row_vals)
+            + "\n"
+        )
         return row_str
 
     def _choose_method(self) -> LetterChoice:
@@ -54,11 +85,11 @@ class CLI:
             POINT_PROMPT.lower(): LetterChoice.POINT,
         }
         while True:
-            input_str = input(
+            input_str = self.read(
                 f"Choose Method to Pick Letters, Choices {list(CHOICE_INPUT.keys())}: "
             )
             if input_str.lower() not in CHOICE_INPUT:
-                print("Invalid method, choose again!")
+                self.write("Invalid method, choose again!")
                 continue
             return CHOICE_INPUT[input_str.lower()]
 
@@ -66,38 +97,47 @@ class CLI:
         """Choose which type of way to get letters based on letter choice and play it. Keep adding onto word and give suggestions.
         If only 1 suggestion left, that is the word, stop! If no letters left to chose but multiple words, just return."""
         self.letter_choice = self._choose_method()
-        PLAY_MAP = {
-            LetterChoice.GRID: self._play_grid,
-            LetterChoice.POINT: self._play_point,
-            LetterChoice.GRID_POINT: self._play_gridpoint,
-        }
         word = BLANK
         incomplete = True
         while incomplete:
             try:
-                print(f"Word so far: {word}")
-                print(
-                    f"Suggestions: ({len(self.comms.filtered_words)}) {self.comms.filtered_words[:MAX_SUGGESTIONS]}"
+                self.write(f"Word so far: {word}")
+                self.write(
+                    f"Suggestions: ({self.comms.num_candidates}) {self.comms.suggestions}"
                 )
-                incomplete, word = PLAY_MAP[self.letter_choice](word)
+                incomplete, word = self.play_step(word)
                 if self.comms.done:
-                    print(f"Done! Final word: {self.comms.filtered_words[0]}")
+                    self.write(f"Done! Final word: {self.comms.suggestions[0]}")
+                    self.comms.learn(self.comms.suggestions[0])
                     return
             except ValueError as e:
-                print(e)
-        print(f"Final word: {word}")
+                self.write(e)
+        self.write(f"Final word: {word}")
+        self.comms.learn(word)
+
+    def play_step(self, word: str) -> tuple[bool, str]:
+        """Pick one letter onto word with method of letter choice, returning if word still incomplete and word."""
+        PLAY_MAP = {
+            LetterChoice.GRID: self._play_grid,
+            LetterChoice.POINT: self._play_point,
+            LetterChoice.GRID_POINT: self._play_gridpoint,
+        }
+        return PLAY_MAP[self.letter_choice](word)
 
     def _play_point(self, word: str) -> tuple[bool, str]:
-        """Point Method where 1 row at time shown, n to pass or choose number 1-#entries left in row.
-        After reducing letter available as follow on to word.."""
+        """Point Method where 1 page at time shown, n to pass or choose number 1-#entries left on page.
+        Pages hold letters available as follow on to word, most likely first, so first pages are usually enough."""
+        if not self.comms.paged:
+            self.comms.eval_grid(word)
+            self.comms.page_grid()
         for row_num in range(self.comms.num_rows):
             row_vals = self.comms.choose_grid_row_reduce(row_num)
             sample_len = len(row_vals)
             point_choices = [CLI_NEXT] + [
                 str(samp_num + 1) for samp_num in range(sample_len)
             ]
-            print(self.display_row(row_num))
-            input_str = input(
+            self.write(self.display_row(row_num))
+            input_str = self.read(
                 f"Enter n/N if letter not on this page, else enter \nChoices {point_choices}: "
             )
             if input_str.lower() == CLI_NEXT:
@@ -110,7 +150,7 @@ class CLI:
             index = int(input_str) - 1
             word += str(row_vals[index])
             self.comms.eval_grid(word)
-            self.comms.reduce_grid()
+            self.comms.page_grid()
             break
 
         return True, word
@@ -123,11 +163,11 @@ class CLI:
         if sample_len == 1:
             row_num = 0
         else:
-            print(self.display_grid())
+            self.write(self.display_grid())
             row_choices = [CLI_DONE] + [
                 str(samp_num + 1) for samp_num in range(sample_len)
             ]
-            input_str = input(
+            input_str = self.read(
                 f"Enter d/D for done making word, else enter row of word \nChoices {row_choices}: "
             )
             if input_str.lower() == CLI_DONE:
@@ -136,12 +176,12 @@ class CLI:
                 raise ValueError("Not a valid choice! Please choose again")
             row_num = int(input_str) - 1
         row_vals = self.comms.choose_grid_row_reduce(row_num)
-        print(self.display_row(row_num))
+        self.write(self.display_row(row_num))
         sample_len = len(row_vals)
         point_choices = [CLI_DONE] + [
             str(samp_num + 1) for samp_num in range(sample_len)
         ]
-        input_str = input(
+        input_str = self.read(
             f"Enter d/D for done making word, else enter 1-{sample_len}\nChoices {point_choices}: "
         )
         if input_str.lower() == CLI_DONE:
@@ -160,31 +200,31 @@ class CLI:
         Grid then clears letters based on available letters for follow letter to work
         and choice between corresponding rows/cols where letters still exist."""
         row_len = self.comms.num_rows
-        print(self.display_grid())
+        self.write(self.display_grid())
         row_choices = [CLI_DONE] + [
             str(row_num + 1)
             for row_num in range(row_len)
             if not len(self.comms.choose_grid_row_reduce(row_num)) == 0
         ]
 
-        input_str = input(
+        input_str = self.read(
             f"Enter d/D for done making word, else enter row of word \nChoices {row_choices}: "
         )
-        if input_str not in row_choices or not input_str.isdigit():
-            raise ValueError("Not a valid choice! Please choose again\n")
         if input_str.lower() == CLI_DONE:
             return False, word
+        if input_str not in row_choices or not input_str.isdigit():
+            raise ValueError("Not a valid choice! Please choose again\n")
         row = int(input_str) - 1
         col_choices = [CLI_DONE] + [
             str(idx + 1) for idx in self.comms.choose_grid_row_reduce_idx(row)
         ]
-        input_str = input(
+        input_str = self.read(
             f"Enter d/D for done making word, else enter col of word \nChoices {col_choices}: "
         )
-        if input_str not in col_choices or not input_str.isdigit():
-            raise ValueError("Not a valid choice! Please choose again\n")
         if input_str.lower() == CLI_DONE:
             return False, word
+        if input_str not in col_choices or not input_str.isdigit():
+            raise ValueError("Not a valid choice! Please choose again\n")
         col = int(input_str) - 1
         word += self.comms.choose_grid_item(row, col)
         self.comms.eval_grid(word)
@@ -1,15 +1,32 @@
+import copy
 import math
 from dataclasses import dataclass
+from functools import partial
+from typing import Optional
 
 from communicate.constants import (
     ALPHABET,
     EMPTY,
     MAX_COLS,
     MAX_ROWS,
-    POSSIBLE_WORDS,
+    MAX_SUGGESTIONS,
+    NGRAM_ORDER,
+    OPTIMIZE_LAYOUT,
+    POINT_PAGE_SIZE,
     SORT_LETTERS,
 )
-from communicate.make_grid import make_grid
+from communicate.grid_cache import GridCache
+from communicate.grid_diff import GridDiff, diff_grids
+from communicate.layout import optimal_grid
+from communicate.lexicon import Lexicon
+from communicate.make_grid import Grid, frozen_grid
+from communicate.ngram import NgramModel
+from communicate.prefetch import StatePrefetcher
+from communicate.prefix_index import PrefixIndex, PrefixNode
+from communicate.prefix_state import PrefixState
+from communicate.shared_lexicon import shared_lexicon
+from communicate.trace import traced
+from communicate.vocabulary import Vocabulary
 
 
 @dataclass
@@ -17,16 +34,36 @@ class Communicator:
     start_grid: list[list[str]]
     smart: bool = False
     include_empty: bool = True
+    prefetch: bool = False
+    profile: Optional[str] = None
+    chunks: bool = False
 
     def __post_init__(self) -> None:
-        """Creates editable grid object."""
-        self.total_frequency_map: dict[str, int] = self.frequency_map()
+        """Creates editable grid object. If prefetching, next letter states are made in background while user chooses.
+        If profile given, words user commits are learned into its personal vocabulary.
+        If chunks, empty cells of grids hold most likely multi letter continuations, picked like a letter.
+        Lexicon, prefix index and ngram model are the process wide shared ones, only first Communicator builds them."""
+        shared = shared_lexicon()
+        self.total_frequency_map: Lexicon = shared.lexicon
+        self.prefix_index: PrefixIndex = shared.prefix_index
+        self.ngram_model: Optional[NgramModel] = shared.ngram_model
+        self.context: tuple[int, ...] = ()
+        self.vocabulary: Optional[Vocabulary] = (
+            Vocabulary(self.profile) if self.profile else None
+        )
+        self.alphabet_grid: Grid = self._alphabet_grid()
+        self.grid_cache: GridCache = GridCache()
+        self.prefetcher: Optional[StatePrefetcher] = (
+            StatePrefetcher() if self.prefetch else None
+        )
+        self.root_state: PrefixState = self._make_state(self.prefix_index.root)
+        self.states: list[PrefixState] = [self.root_state]
         self.reset_grid()
 
     @property
     def done(self) -> bool:
         """Done if only one word left or no letters left to suggest."""
-        return len(self.filtered_words) == 1 or len(self.remain_letters) == 0
+        return self.num_candidates == 1 or len(self.remain_letters) == 0
 
     @property
     def grid_size(self) -> int:
@@ -34,9 +71,13 @@ class Communicator:
         Calculates grid size of remaining letters excluding empty spaces.
         If empty spaces includes, make grid size start grid size since remain letters won't account for empty spaces.
         """
-        if self.include_empty:
+        return self._grid_size(self.remain_letters, self.include_empty)
+
+    def _grid_size(self, letters: list[str], include_empty: bool) -> int:
+        """Grid size of letters, start grid size if including empty spaces."""
+        if include_empty:
             return len([letter for row in self.start_grid for letter in row])
-        return len([letter for row in self.remain_letters for letter in row])
+        return len([letter for row in letters for letter in row])
 
     @property
     def max_dim(self) -> int:
@@ -45,39 +86,84 @@ class Communicator:
 
     @property
     def num_cols(self) -> int:
-        """Gets approximately square grid number of columns based on ceil(sqrt(size))."""
-        cols = math.ceil(math.sqrt(self.grid_size))
-        return cols if cols <= MAX_COLS else MAX_COLS
+        """Gets approximately square grid number of columns based on ceil(sqrt(size)), letters per page if paged."""
+        return self._layout_shape()[1]
 
     @property
     def num_rows(self) -> int:
-        """Gets number of rows from claculated number of cols and grid size."""
-        if self.num_cols == 0:
-            return 0
-        rows = math.ceil(self.grid_size / self.num_cols)
-        return rows if rows <= MAX_ROWS else MAX_ROWS
-
-    def frequency_map(self) -> dict[str, int]:
-        """Function to take all possible words in corpuses and get frequency count of them
-        Then sort map by most common to least common words."""
-        filtered_words = [
-            word
-            for word in POSSIBLE_WORDS
-            if all(letter in ALPHABET for letter in word)
-        ]
-        sorted_words = sorted(filtered_words)
-        freq_map: dict[str, int] = {}
-        for word in sorted_words:
-            if word not in freq_map:
-                freq_map[word] = 0
-            freq_map[word] += 1
-        freq_map_sorted = dict(
-            sorted(freq_map.items(), key=lambda x: x[1], reverse=True)
+        """Gets number of rows from claculated number of cols and grid size, number of pages if paged."""
+        return self._layout_shape()[0]
+
+    def _layout_shape(self) -> tuple[int, int]:
+        """Rows and columns of current grid, one row per page if paged."""
+        if self.paged:
+            return self._page_shape(len(self.remain_letters))
+        return self._grid_shape(self.grid_size, self.include_empty)
+
+    def _page_shape(self, num_letters: int) -> tuple[int, int]:
+        """Pages and letters per page to fit letters, at most page size letters on each page."""
+        cols = min(num_letters, POINT_PAGE_SIZE)
+        if cols == 0:
+            return 0, 0
+        return math.ceil(num_letters / cols), cols
+
+    def _grid_shape(self, grid_size: int, include_empty: bool) -> tuple[int, int]:
+        """Rows and columns of approximately square grid of size, columns ceil(sqrt(size)) and rows to fit.
+        If optimizing layout and reduced letters fit in one row, use one row so row choice is skipped."""
+        if OPTIMIZE_LAYOUT and not include_empty and grid_size <= MAX_COLS:
+            cols = grid_size
+        else:
+            cols = min(math.ceil(math.sqrt(grid_size)), MAX_COLS)
+        if cols == 0:
+            return 0, 0
+        return min(math.ceil(grid_size / cols), MAX_ROWS), cols
+
+    def frequency_map(self) -> Lexicon:
+        """Function to get word frequency counts from compiled lexicon of corpuses.
+        Lexicon is read only mapping of word to count over its mapped arrays, so no dict of every word is built,
+        and it is loaded once per process and shared."""
+        return shared_lexicon().lexicon
+
+    def new_session(self, profile: Optional[str] = None) -> "Communicator":
+        """New Communicator for another user sharing this one's grid cache, with its own sentence context,
+        personal vocabulary and prefix states, so each extra session only costs its own states.
+        Read only lexicon, prefix index and ngram model are shared by every Communicator anyway."""
+        session = copy.copy(self)
+        session.context = ()
+        session.profile = profile
+        session.vocabulary = Vocabulary(profile) if profile else None
+        session.prefetcher = StatePrefetcher() if self.prefetch else None
+        session.root_state = session._make_state(self.prefix_index.root)
+        session.reset_grid()
+        return session
+
+    def use_profile(self, profile: Optional[str]) -> None:
+        """Switch to personal vocabulary of profile, or none. States are remade from empty word with its counts."""
+        self.profile = profile
+        self.vocabulary = Vocabulary(profile) if profile else None
+        self._remake_states()
+
+    def learn(self, word: str) -> None:
+        """Record word user committed in personal vocabulary if any, so it ranks higher from next word on,
+        merging into counts of states as they are made instead of rebuilding frequency map."""
+        if self.vocabulary is not None and self.vocabulary.record(word):
+            self._remake_states()
+
+    def _remake_states(self) -> None:
+        """Remake prefix states from empty word, when context or counts they were ranked with changed."""
+        self._clear_prefetched()
+        self.root_state = self._make_state(self.prefix_index.root)
+        self.states = [self.root_state]
+
+    def is_word(self, word: str) -> bool:
+        """Check word is in corpus by bisecting sorted words of frequency map, or in personal vocabulary."""
+        word = word.lower()
+        return word in self.total_frequency_map or (
+            self.vocabulary is not None and word in self.vocabulary
         )
-        return freq_map_sorted
 
     def choose_grid_item(self, row: int, col: int) -> str:
-        """Chooses letter from grid given row/column, Col 0:SAMPLE_LENGTH-1, ROW:0:"""
+        """Chooses letter or chunk of letters from grid given row/column, Col 0:SAMPLE_LENGTH-1, ROW:0:"""
         row_entries = self.choose_grid_row(row)
         if col > len(row_entries):
             raise ValueError("Col out of bounds")
@@ -86,7 +172,7 @@ class Communicator:
             raise ValueError("Cannot pick blank space!")
         return item
 
-    def choose_grid_row(self, row: int) -> list[str]:
+    def choose_grid_row(self, row: int) -> tuple[str, ...]:
         """Gets letters of chosen row from grid. Make sure row choice is allowable."""
         if row > len(self.remain_grid):
             raise ValueError("Row out of bounds")
@@ -114,79 +200,369 @@ class Communicator:
         return [letter for letter in col_raw if letter != EMPTY]
 
     def reset_grid(self) -> None:
-        """Creates editable grid object."""
-        self.filtered_words: list[str] = []
+        """Creates editable grid object. Prefix state stack goes back to only empty word state."""
+        self._clear_prefetched()
+        self.states = [self.root_state]
+        self.suggestions: list[str] = []
+        self.num_candidates: int = 0
         self.remain_letters: list[str] = [letter for letter in ALPHABET]
-        self.remain_grid: list[list[str]] = make_grid(
-            MAX_ROWS, MAX_COLS, self.remain_letters
+        self.remain_grid: Grid = (
+            self._fill_chunks(self.root_state, self.alphabet_grid)
+            if self.chunks
+            else self.alphabet_grid
+        )
+        self.paged: bool = False
+
+    def render_diff(
+        self,
+        shown_grid: Optional[Grid] = None,
+        shown_suggestions: Optional[list[str]] = None,
+    ) -> GridDiff:
+        """Diff of remaining grid and suggestions against ones a display last showed, all cells if nothing shown."""
+        return diff_grids(
+            shown_grid, self.remain_grid, shown_suggestions, self.suggestions
         )
 
+    def _alphabet_grid(self) -> Grid:
+        """Full grid of alphabet that clearing blanks letters from, so letters never move while clearing.
+        Built once and never changes, so resetting just points back to it.
+        Alphabetical, or if optimizing layout, most common letters over corpus in cells of least pointing distance."""
+        if not OPTIMIZE_LAYOUT:
+            return frozen_grid(MAX_ROWS, MAX_COLS, tuple(ALPHABET))
+        return optimal_grid(MAX_ROWS, MAX_COLS, self.prefix_index.letters_by_count())
+
+    @traced("eval_grid")
     def eval_grid(self, word: str) -> list[str]:
         """If smart system, use letter frequency to filter out impossible letters if not in frequency map.
         Order remaining words by frequency based on frequency in corpus."""
-        frequency_map = self._next_letter_frequency(word)
-        if not self.smart:
-            return self.remain_letters
-        ordered_letters = self._find_ordered_letters(frequency_map)
-        self.remain_letters = ordered_letters
+        self._next_letter_frequency(word)
+        self.remain_letters = self._state_letters(self.states[-1])
         return self.remain_letters
 
+    def _state_letters(self, state: PrefixState) -> list[str]:
+        """Letters left after state, all of alphabet if not smart."""
+        if not self.smart:
+            return [letter for letter in ALPHABET]
+        return state.ordered_letters
+
+    def push_letter(self, letter: str) -> PrefixState:
+        """Narrow top prefix state by next letter and push new state onto stack, taking prefetched state if ready."""
+        top = self.states[-1]
+        state = (
+            self.prefetcher.take(top.word + letter)
+            if self.prefetcher is not None
+            else None
+        )
+        self.states.append(state or self._child_state(top, letter))
+        return self.states[-1]
+
+    def _child_state(self, top: PrefixState, letter: str) -> PrefixState:
+        """State of top state narrowed by next letter, empty node if no word continues with letter."""
+        node = self.prefix_index.child(top.node, letter) or PrefixNode(
+            top.word + letter, 0, 0
+        )
+        return self._make_state(node)
+
+    def pop_letter(self) -> PrefixState:
+        """Undo last letter by popping top prefix state, empty word state is never popped.
+        Prefetched states were for letters after popped one, so they are dropped."""
+        self._clear_prefetched()
+        if len(self.states) > 1:
+            self.states.pop()
+        return self.states[-1]
+
+    @traced("set_context")
+    def set_context(self, sentence: str) -> None:
+        """Use last words of sentence as context for ranking suggestions and letters.
+        Context stops at first word from end not in corpus. If context changed, states are remade from empty word."""
+        context: list[int] = []
+        for word in reversed(sentence.lower().split()[-(NGRAM_ORDER - 1) :]):
+            word_id = self.prefix_index.word_id(word)
+            if word_id is None:
+                break
+            context.insert(0, word_id)
+        if tuple(context) == self.context:
+            return
+        self.context = tuple(context)
+        self._remake_states()
+
+    def _context_successors(
+        self, node: PrefixNode, context: tuple[int, ...]
+    ) -> list[tuple[int, int]]:
+        """Word ids of node range seen after sentence context with counts, most common first.
+        Backs off to shorter context if longest one never continues with prefix."""
+        if self.ngram_model is None:
+            return []
+        for length in range(len(context), 0, -1):
+            successors = self.ngram_model.successors(
+                context[-length:], node.start, node.end
+            )
+            if successors:
+                return successors
+        return []
+
+    @traced("make_state")
+    def _make_state(self, node: PrefixNode) -> PrefixState:
+        """Make prefix state of node, ordering its next letters and suggestions once.
+        Words seen after sentence context are suggested first and their next letters ordered first, then most common words fill in.
+        Words of personal vocabulary starting with prefix add their counts to node's next letters and most common words."""
+        context = self.context
+        personal = (
+            self.vocabulary.completions(node.prefix)
+            if self.vocabulary is not None
+            else []
+        )
+        successors = self._context_successors(node, context)
+        context_letter_count: dict[str, int] = {}
+        for word_id, count in successors:
+            word = self.prefix_index.words[word_id]
+            if len(word) > len(node.prefix):
+                next_letter = word[len(node.prefix)]
+                context_letter_count[next_letter] = (
+                    context_letter_count.get(next_letter, 0) + count
+                )
+        suggestions = [
+            self.prefix_index.words[word_id]
+            for word_id, _ in successors[:MAX_SUGGESTIONS]
+        ]
+        suggestions += [
+            word
+            for word in self._top_words(node, personal)
+            if word not in suggestions
+        ]
+        next_letter_count = self._personal_letter_count(node, personal)
+        return PrefixState(
+            word=node.prefix,
+            node=node,
+            ordered_letters=self._find_ordered_letters(
+                next_letter_count, context_letter_count
+            ),
+            suggestions=suggestions[:MAX_SUGGESTIONS],
+            next_letter_count=next_letter_count,
+            num_words=node.num_words
+            + sum(word not in self.total_frequency_map for word, _ in personal),
+            context_letter_count=context_letter_count,
+            context=context,
+            version=self.vocabulary.version if self.vocabulary is not None else 0,
+        )
+
+    def _top_words(self, node: PrefixNode, personal: list[tuple[str, int]]) -> list[str]:
+        """Most common words of node, with personal words ranked in by corpus count plus personal count.
+        Other corpus words rank below node's top words, so only those and personal words can make the cut."""
+        if not personal:
+            return node.top_words
+        counts = {word: self.total_frequency_map.get(word, 0) for word in node.top_words}
+        for word, count in personal:
+            counts[word] = counts.get(word, self.total_frequency_map.get(word, 0)) + count
+        return sorted(counts, key=lambda word: (-counts[word], word))[:MAX_SUGGESTIONS]
+
+    def _personal_letter_count(
+        self, node: PrefixNode, personal: list[tuple[str, int]]
+    ) -> dict[str, int]:
+        """Next letter counts of node with counts of personal words longer than prefix added, node's own if none."""
+        if not personal:
+            return node.next_letter_count
+        letter_count = dict(node.next_letter_count)
+        for word, count in personal:
+            if len(word) > len(node.prefix):
+                next_letter = word[len(node.prefix)]
+                letter_count[next_letter] = letter_count.get(next_letter, 0) + count
+        return letter_count
+
+    def _sync_states(self, word: str) -> PrefixState:
+        """Pop states until top is prefix of word then push its remaining letters, so only changed letters get evaluated."""
+        word = word.lower()
+        while not word.startswith(self.states[-1].word):
+            self.pop_letter()
+        for letter in word[len(self.states[-1].word) :]:
+            self.push_letter(letter)
+        return self.states[-1]
+
     def _find_invalid_letters(self, frequency_map: dict[str, int]) -> list[str]:
         """Method to explictly get invalid letters based on letters not in frequency map for word."""
         alphabet_set = {letter.lower() for letter in ALPHABET}
         invalid_letters = alphabet_set - set(frequency_map.keys())
         return [invalid_l for invalid_l in invalid_letters]
 
-    def _find_ordered_letters(self, frequency_map: dict[str, int]) -> list[str]:
+    @traced("order_letters")
+    def _find_ordered_letters(
+        self,
+        frequency_map: dict[str, int],
+        context_map: Optional[dict[str, int]] = None,
+    ) -> list[str]:
         """Method to explictly get letters in order of most common in frequency map for word.
         If sort letters, return letters in order of frequency, else alphabetical.
+        If context map given, letters of words seen after sentence context go first in order of context frequency.
         """
+        context_map = context_map or {}
         return (
-            list(
-                dict(
-                    sorted(frequency_map.items(), key=lambda x: x[1], reverse=True)
-                ).keys()
+            sorted(
+                frequency_map,
+                key=lambda x: (context_map.get(x, 0), frequency_map[x]),
+                reverse=True,
             )
             if SORT_LETTERS
             else sorted(frequency_map)
         )
 
     def _next_letter_frequency(self, word: str) -> dict[str, int]:
-        """Method that filters all words for only words that begin with word substring.
-        Then from those words creates frequency map of next letter to number of words with that letter to determine most likely next letter."""
-        next_idx = len(word)
-        self.filtered_word_dist: dict[str, int] = {
-            poss_word: freq
-            for poss_word, freq in self.total_frequency_map.items()
-            if poss_word.startswith(word.lower())
-        }
-        self.filtered_words = list(self.filtered_word_dist.keys())
-        next_letter_count: dict[str, int] = {}
-        for filt_word, freq in self.filtered_word_dist.items():
-            if len(filt_word) > len(word):
-                next_letter = filt_word[next_idx]
-                if next_letter not in ALPHABET:
-                    continue
-                if next_letter not in next_letter_count:
-                    next_letter_count[next_letter] = 0
-                next_letter_count[next_letter] += freq
-        return next_letter_count
-
-    def clear_grid(self) -> list[list[str]]:
+        """Method that moves prefix state stack to word substring, state node range holds only words that begin with word substring.
+        Node already has frequency map of next letter to number of words with that letter to determine most likely next letter,
+        as well as most common words to suggest and number of words left, so matching words are never copied."""
+        state = self._sync_states(word)
+        self.suggestions = state.suggestions
+        self.num_candidates = state.num_words
+        return dict(state.next_letter_count)
+
+    def _cached_grid(
+        self,
+        state: PrefixState,
+        letters: list[str],
+        include_empty: bool,
+        paged: bool = False,
+    ) -> Grid:
+        """Get grid of letters from per prefix grid cache, building it only first time for prefix and those letters."""
+        return self.grid_cache.get(
+            (
+                state.context,
+                state.word,
+                include_empty,
+                paged,
+                self.chunks,
+                tuple(letters),
+                state.version,
+            ),
+            partial(self._filled_grid, state, letters, include_empty, paged),
+        )
+
+    def _filled_grid(
+        self, state: PrefixState, letters: list[str], include_empty: bool, paged: bool
+    ) -> Grid:
+        """Grid of letters with empty cells filled with chunks if using them.
+        Point pages are left as they are, their only empty cells are on last page where a chunk costs every page flip."""
+        grid = self._build_grid(state, letters, include_empty, paged)
+        return self._fill_chunks(state, grid) if self.chunks and not paged else grid
+
+    @traced("fill_chunks")
+    def _fill_chunks(self, state: PrefixState, grid: Grid) -> Grid:
+        """Fill empty cells in reading order with most likely multi letter continuations of state's prefix,
+        so a common ending like ing costs one pick instead of one per letter. Letters never move, cells left over stay empty."""
+        num_empty = sum(letter == EMPTY for row in grid for letter in row)
+        chunks = iter(self.prefix_index.chunks(state.node, num_empty))
+        return tuple(
+            tuple(next(chunks, EMPTY) if letter == EMPTY else letter for letter in row)
+            for row in grid
+        )
+
+    @traced("build_grid")
+    def _build_grid(
+        self,
+        state: PrefixState,
+        letters: list[str],
+        include_empty: bool,
+        paged: bool = False,
+    ) -> Grid:
+        """Cleared full grid of letters if including empty spaces, else reduced grid of just letters.
+        Reduced layouts come from cached grids shared by every prefix with same letters.
+        If optimizing layout, most likely next letters of reduced grid go in cells of least pointing distance.
+        If paged, each row is a page of Point method holding next most likely letters, so likeliest letters
+        are on first page. With every page the same size, that order needs fewest expected page flips."""
+        if paged:
+            num_pages, page_size = self._page_shape(len(letters))
+            return frozen_grid(
+                num_pages, page_size, tuple(self._ranked_letters(state, letters))
+            )
+        if include_empty:
+            letter_set = set(letters)
+            return tuple(
+                tuple(letter if letter in letter_set else EMPTY for letter in row)
+                for row in self.alphabet_grid
+            )
+        num_rows, num_cols = self._grid_shape(self._grid_size(letters, False), False)
+        if OPTIMIZE_LAYOUT:
+            return optimal_grid(
+                num_rows, num_cols, tuple(self._ranked_letters(state, letters))
+            )
+        return frozen_grid(num_rows, num_cols, tuple(letters))
+
+    @traced("clear_grid")
+    def clear_grid(self) -> Grid:
         """Clears letter from grid without changing grid size.
         Set include empty to True to denote clearing not reducing.
         """
         self.include_empty = True
-        clear_letters = [
-            letter if letter in self.remain_letters else EMPTY for letter in ALPHABET
-        ]
-        self.remain_grid = make_grid(MAX_ROWS, MAX_COLS, clear_letters)
+        self.paged = False
+        self.remain_grid = self._cached_grid(
+            self.states[-1], self.remain_letters, True
+        )
+        self._prefetch_next()
         return self.remain_grid
 
-    def reduce_grid(self) -> list[list[str]]:
+    @traced("reduce_grid")
+    def reduce_grid(self) -> Grid:
         """Given letters to remove, reduce number of letters in grid and reduce grid size if possible.
         Set include empty to False to denote reducing not clearing."""
         self.include_empty = False
-        reduce_letters = [letter for letter in self.remain_letters]
-        self.remain_grid = make_grid(self.num_rows, self.num_cols, reduce_letters)
+        self.paged = False
+        self.remain_grid = self._cached_grid(
+            self.states[-1], self.remain_letters, False
+        )
+        self._prefetch_next()
+        return self.remain_grid
+
+    @traced("page_grid")
+    def page_grid(self) -> Grid:
+        """Lay letters left out as pages for Point method, one row per page from most to least likely next letters.
+        Pages are cached per prefix and prefetched with next letters' states, so turning a page only shows next row."""
+        self.include_empty = False
+        self.paged = True
+        self.remain_grid = self._cached_grid(
+            self.states[-1], self.remain_letters, False, True
+        )
+        self._prefetch_next()
         return self.remain_grid
+
+    def _prefetch_next(self) -> None:
+        """If prefetching, start making state and grid of each letter on grid in background, most likely first,
+        so picking one only takes ready state."""
+        if self.prefetcher is None:
+            return
+        top = self.states[-1]
+        include_empty = self.include_empty
+        paged = self.paged
+        self.prefetcher.prefetch(
+            {
+                top.word + letter: partial(
+                    self._prefetch_state, top, letter, include_empty, paged
+                )
+                for letter in self._ranked_letters(top, self.remain_letters)
+            }
+        )
+
+    def _prefetch_state(
+        self, top: PrefixState, letter: str, include_empty: bool, paged: bool
+    ) -> PrefixState:
+        """Make state of letter after top state and its grid, run on prefetch thread."""
+        state = self._child_state(top, letter)
+        self._cached_grid(state, self._state_letters(state), include_empty, paged)
+        return state
+
+    def _clear_prefetched(self) -> None:
+        """Drop prefetched states, on undo or when sentence context changes."""
+        if self.prefetcher is not None:
+            self.prefetcher.clear()
+
+    def ranked_letters(self) -> list[str]:
+        """Letters left from most to least likely next, for scanning them in that order."""
+        return self._ranked_letters(self.states[-1], self.remain_letters)
+
+    def _ranked_letters(self, state: PrefixState, letters: list[str]) -> list[str]:
+        """Letters from most to least likely next after state, by sentence context then corpus counts."""
+        return sorted(
+            letters,
+            key=lambda x: (
+                state.context_letter_count.get(x, 0),
+                state.next_letter_count.get(x, 0),
+            ),
+            reverse=True,
+        )
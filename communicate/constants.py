@@ -1,22 +1,36 @@
-import nltk  # type: ignore
-from nltk.corpus import abc, webtext, words  # type: ignore
+import tempfile
+from pathlib import Path
 
 # GLOBAL VALUES
-nltk.download("webtext")
-nltk.download("abc")
-nltk.download("words")
 ALPHABET: list[str] = [chr(char_num) for char_num in range(ord("a"), ord("z") + 1)]
-POSSIBLE_WORDS: list[str] = (
-    [word.lower() for word in words.words()]
-    + [word.lower() for word in abc.words()]
-    + [word.lower() for word in webtext.words()]
-)
+LEXICON_PATH: Path = Path(__file__).parent / "data" / "lexicon.bin"
+NGRAM_PATH: Path = Path(__file__).parent / "data" / "ngrams.bin"
+TRACE_ENV: str = "COMMUNICATE_TRACE"
+TRACE_FORMAT_ENV: str = "COMMUNICATE_TRACE_FORMAT"
+SERVER_ENV: str = "COMMUNICATE_SERVER"
+SERVER_SOCKET: Path = Path(tempfile.gettempdir()) / "communicate.sock"
+PROFILE_ENV: str = "COMMUNICATE_PROFILE"
+PROFILE_DIR: Path = Path.home() / ".communicate" / "profiles"
+DEFAULT_PROFILE: str = "default"
 
 # Parameters
 MAX_ROWS: int = 6
 MAX_COLS: int = 5
 MAX_SUGGESTIONS: int = 5
+POINT_PAGE_SIZE: int = MAX_COLS
+MAX_CHUNK_LENGTH: int = 4
+CHUNK_MIN_SHARE: float = 0.05
 SORT_LETTERS: bool = False
+OPTIMIZE_LAYOUT: bool = False
+NGRAM_ORDER: int = 3
+NGRAM_MIN_COUNT: int = 2
+PREFETCH_SIZE: int = 64
+GRID_CACHE_SIZE: int = 1024
+LAYOUT_CACHE_SIZE: int = 256
+VOCAB_HALF_LIFE_DAYS: float = 30.0
+VOCAB_USE_COUNT: int = 1000
+VOCAB_MIN_USES: float = 0.05
+VOCAB_COMPACT_EVERY: int = 256
 
 # Interface Constsnts
 EMPTY: str = "_"
@@ -24,3 +38,4 @@ BLANK: str = ""
 GRID_PROMPT: str = "Clear"
 GRIDPOINT_PROMPT: str = "Reduce"
 POINT_PROMPT: str = "Point"
+SCAN_PROMPT: str = "Scan"
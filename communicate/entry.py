@@ -0,0 +1,121 @@
+import argparse
+import importlib
+import os
+import sys
+from typing import TYPE_CHECKING, Optional
+
+from communicate.constants import DEFAULT_PROFILE, PROFILE_ENV, SERVER_ENV
+
+if TYPE_CHECKING:
+    from communicate.communicator import Communicator
+
+# ENTRY VALUES
+UI_MODES: list[str] = ["cli", "gui"]
+TOOL_MODULES: dict[str, str] = {
+    "batch": "communicate.batch",
+    "build-lexicon": "communicate.build_lexicon",
+    "bench": "communicate.bench",
+    "serve": "communicate.server",
+    "simulate": "communicate.simulate",
+}
+TOOL_FLAGS: dict[str, str] = {"--custom": "custom", "--chunks": "chunks"}
+
+
+def make_communicator(
+    smart: bool = True,
+    address: Optional[str] = None,
+    prefetch: bool = False,
+    profile: Optional[str] = None,
+    chunks: bool = False,
+) -> "Communicator":
+    """Communicator loading lexicon now that a mode needs it, or thin client of a session on prediction server at address.
+    Words committed are learned into personal vocabulary of profile if given. Empty cells hold letter chunks if asked."""
+    from communicate.constants import ALPHABET, MAX_COLS, MAX_ROWS
+    from communicate.make_grid import make_grid
+
+    start_grid = make_grid(MAX_ROWS, MAX_COLS, ALPHABET)
+    if address:
+        from communicate.remote import RemoteCommunicator
+        from communicate.server import parse_address
+
+        return RemoteCommunicator(
+            start_grid=start_grid,
+            smart=smart,
+            profile=profile,
+            chunks=chunks,
+            address=parse_address(address),
+        )
+    from communicate.communicator import Communicator
+
+    return Communicator(
+        start_grid=start_grid,
+        smart=smart,
+        prefetch=prefetch,
+        profile=profile,
+        chunks=chunks,
+    )
+
+
+def run_cli(
+    smart: bool = True,
+    address: Optional[str] = None,
+    profile: Optional[str] = None,
+    chunks: bool = False,
+) -> None:
+    """Play in terminal, never importing tkinter or GUI."""
+    from communicate.cli import CLI
+
+    CLI(comms=make_communicator(smart, address, profile=profile, chunks=chunks)).play()
+
+
+def run_gui(
+    smart: bool = True,
+    address: Optional[str] = None,
+    profile: Optional[str] = None,
+    chunks: bool = False,
+) -> None:
+    """Open GUI, states of letters on screen are prefetched unless served by prediction server."""
+    from communicate.gui import GUI
+
+    GUI(comms=make_communicator(smart, address, True, profile, chunks)).mainloop()
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Console entry point. Only modules of chosen mode are imported, and lexicon is only loaded once mode needs it,
+    so asking for help or building lexicon never pays for GUI, numpy or lexicon. Tool modes get rest of arguments,
+    and --custom or --chunks if given before mode."""
+    parser = argparse.ArgumentParser(
+        prog="communicate", description="Communication helper and its tools"
+    )
+    parser.add_argument(
+        "mode",
+        choices=UI_MODES + list(TOOL_MODULES),
+        help="tool modes take their own arguments, see communicate MODE --help",
+    )
+    parser.add_argument("--custom", action="store_true", help="turn smart mode off")
+    parser.add_argument(
+        "--server",
+        default=os.environ.get(SERVER_ENV),
+        help="prediction server address to use instead of loading lexicon",
+    )
+    parser.add_argument(
+        "--profile",
+        default=os.environ.get(PROFILE_ENV, DEFAULT_PROFILE),
+        help="user whose committed words are learned, empty for none",
+    )
+    parser.add_argument(
+        "--chunks", action="store_true", help="fill empty cells with likely letter chunks"
+    )
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in TOOL_MODULES:
+        importlib.import_module(TOOL_MODULES[argv[0]]).main(argv[1:])
+        return
+    args, rest = parser.parse_known_args(argv)
+    if args.mode in TOOL_MODULES:
+        flags = [flag for flag, on in TOOL_FLAGS.items() if getattr(args, on)]
+        importlib.import_module(TOOL_MODULES[args.mode]).main(flags + rest)
+        return
+    if rest:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    run = run_cli if args.mode == "cli" else run_gui
+    run(not args.custom, args.server, args.profile or None, args.chunks)
@@ -0,0 +1,130 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from communicate.communicator import Communicator
+from communicate.constants import BLANK
+from communicate.letter_choice import LetterChoice
+from communicate.make_grid import Grid
+from communicate.trace import traced
+
+
+@dataclass(frozen=True)
+class Evaluation:
+    """Snapshot of Communicator after evaluating one word, so GUI thread reads it instead of Communicator mid update.
+    Generation is token of request it answers, letter choice is method grid was laid out for,
+    auto done if request was a letter pick that should finish word when done.
+    Ranked letters are letters left from most to least likely next, num candidates is number of words left."""
+
+    generation: int
+    word: str
+    sentence: str
+    smart: bool
+    letter_choice: LetterChoice
+    grid: Grid
+    suggestions: list[str]
+    ranked_letters: list[str]
+    done: bool
+    num_candidates: int
+    is_word: bool
+    auto_done: bool
+
+
+@dataclass
+class Evaluator:
+    """Runs every Communicator evaluation on one worker thread, so Tk event loop never waits on lexicon work.
+
+    Each request gets next generation token and cancels request before it if not started yet.
+    Requests carry whole word, sentence and smart mode rather than changes, so skipping stale ones loses nothing,
+    and results of older generations are thrown away. Communicator is only touched on worker thread.
+    Committed words to learn are queued apart from requests, so cancelling a request never loses one,
+    and each stays queued until learning it succeeds.
+    """
+
+    comms: Communicator
+
+    def __post_init__(self) -> None:
+        """Start worker thread, generation 0 means nothing requested yet."""
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evaluate")
+        self._future: Optional[Future] = None
+        self.generation: int = 0
+        self._learn: deque[str] = deque()
+
+    def submit(
+        self,
+        word: str,
+        sentence: str,
+        smart: bool,
+        letter_choice: LetterChoice,
+        auto_done: bool = False,
+        learn: str = BLANK,
+    ) -> int:
+        """Request evaluation of word in sentence after learning committed word if given, returning its generation token."""
+        if learn:
+            self._learn.append(learn)
+        self.generation += 1
+        if self._future is not None:
+            self._future.cancel()
+        self._future = self._executor.submit(
+            self._evaluate,
+            self.generation,
+            word,
+            sentence,
+            smart,
+            letter_choice,
+            auto_done,
+        )
+        return self.generation
+
+    @traced("evaluate")
+    def _evaluate(
+        self,
+        generation: int,
+        word: str,
+        sentence: str,
+        smart: bool,
+        letter_choice: LetterChoice,
+        auto_done: bool,
+    ) -> Evaluation:
+        """Learn queued committed words, then evaluate word and clear grid for Grid method, lay out pages for Point
+        or reduce it for others, run on worker thread. Every page comes in grid, so turning one needs no request."""
+        while self._learn:
+            self.comms.learn(self._learn[0])
+            self._learn.popleft()
+        self.comms.smart = smart
+        self.comms.set_context(sentence)
+        self.comms.eval_grid(word)
+        if letter_choice == LetterChoice.GRID:
+            self.comms.clear_grid()
+        elif letter_choice == LetterChoice.POINT:
+            self.comms.page_grid()
+        else:
+            self.comms.reduce_grid()
+        return Evaluation(
+            generation=generation,
+            word=word,
+            sentence=sentence,
+            smart=smart,
+            letter_choice=letter_choice,
+            grid=self.comms.remain_grid,
+            suggestions=self.comms.suggestions,
+            ranked_letters=self.comms.ranked_letters(),
+            done=self.comms.done,
+            num_candidates=self.comms.num_candidates,
+            is_word=self.comms.is_word(word),
+            auto_done=auto_done,
+        )
+
+    @property
+    def pending(self) -> bool:
+        """Whether latest request is still being evaluated."""
+        return self._future is not None and not self._future.done()
+
+    def result(self, wait: bool = False) -> Optional[Evaluation]:
+        """Evaluation of latest request once ready, waiting for it if asked. None if not ready or stale.
+        Raises whatever evaluating it raised."""
+        if self._future is None or (self.pending and not wait):
+            return None
+        evaluation = self._future.result()
+        return evaluation if evaluation.generation == self.generation else None
@@ -0,0 +1,45 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from communicate.constants import GRID_CACHE_SIZE
+from communicate.make_grid import Grid
+
+# Grid cache key of sentence context, word, include empty, paged, chunks, letters of grid and personal vocabulary version
+GridKey = tuple[tuple[int, ...], str, bool, bool, bool, tuple[str, ...], int]
+
+
+@dataclass
+class GridCache:
+    """Bounded LRU cache of finished grids per prefix, so prefixes seen again like common word starts
+    or undo and redo of a letter reuse grid instead of building it. Locked since prefetch thread fills it too."""
+
+    size: int = GRID_CACHE_SIZE
+
+    def __post_init__(self) -> None:
+        """Empty cache with hit and miss counters."""
+        self._grids: OrderedDict[GridKey, Grid] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: GridKey, build: Callable[[], Grid]) -> Grid:
+        """Cached grid of key, building and caching it on miss and dropping least recently used past size."""
+        with self._lock:
+            if key in self._grids:
+                self.hits += 1
+                self._grids.move_to_end(key)
+                return self._grids[key]
+            self.misses += 1
+        grid = build()
+        with self._lock:
+            self._grids[key] = grid
+            while len(self._grids) > self.size:
+                self._grids.popitem(last=False)
+        return grid
+
+    def clear(self) -> None:
+        """Drop every cached grid, counters are kept."""
+        with self._lock:
+            self._grids.clear()
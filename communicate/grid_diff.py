@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from communicate.make_grid import Grid
+
+
+@dataclass(frozen=True)
+class GridDiff:
+    """Changes between grid and suggestions last shown and new ones, so displays only redraw what changed.
+
+    Cells maps (row, col) of each changed cell to its new letter. If grid was resized, or nothing was shown yet,
+    every cell of new grid is in cells. Suggestions are None if unchanged.
+    """
+
+    cells: dict[tuple[int, int], str]
+    resized: bool
+    suggestions: Optional[list[str]]
+
+    @property
+    def rows(self) -> list[int]:
+        """Rows with any changed cell, in order."""
+        return sorted({row for row, _ in self.cells})
+
+
+def grid_shape(grid: Grid) -> tuple[int, ...]:
+    """Length of each row of grid."""
+    return tuple(len(row) for row in grid)
+
+
+def diff_grids(
+    old_grid: Optional[Grid],
+    new_grid: Grid,
+    old_suggestions: Optional[list[str]] = None,
+    new_suggestions: Optional[list[str]] = None,
+) -> GridDiff:
+    """Diff of new grid and suggestions against old ones. Cached grids and rows are shared objects,
+    so unchanged ones are skipped by identity before comparing letters."""
+    suggestions = None if new_suggestions == old_suggestions else new_suggestions
+    if old_grid is None or grid_shape(old_grid) != grid_shape(new_grid):
+        return GridDiff(
+            cells={
+                (row_num, col_num): letter
+                for row_num, row in enumerate(new_grid)
+                for col_num, letter in enumerate(row)
+            },
+            resized=True,
+            suggestions=suggestions,
+        )
+    cells = {}
+    if old_grid is not new_grid:
+        for row_num, (old_row, new_row) in enumerate(zip(old_grid, new_grid)):
+            if old_row is new_row or old_row == new_row:
+                continue
+            for col_num, (old_letter, new_letter) in enumerate(zip(old_row, new_row)):
+                if old_letter != new_letter:
+                    cells[(row_num, col_num)] = new_letter
+    return GridDiff(cells=cells, resized=False, suggestions=suggestions)
@@ -1,6 +1,9 @@
+import time
 import tkinter as tk
+import tkinter.font
+from dataclasses import replace
 from functools import partial
-from typing import Optional
+from typing import Callable, Optional
 
 from communicate.communicator import Communicator
 from communicate.constants import (
@@ -8,11 +11,19 @@ from communicate.constants import (
     EMPTY,
     GRID_PROMPT,
     GRIDPOINT_PROMPT,
+    MAX_COLS,
+    MAX_ROWS,
     MAX_SUGGESTIONS,
     POINT_PROMPT,
-    POSSIBLE_WORDS,
+    SCAN_PROMPT,
 )
+from communicate.evaluator import Evaluation, Evaluator
+from communicate.grid_diff import GridDiff, diff_grids
 from communicate.letter_choice import LetterChoice
+from communicate.make_grid import Grid
+from communicate.scan import SCAN_LOG_NAME, Scanner, scan_groups
+from communicate.trace import TRACER, traced
+from communicate.vocabulary import profile_path
 
 # GUI VALUES
 TITLE: str = "LetterPicker"
@@ -38,10 +49,23 @@ BACK_TEXT: str = "Back"
 DONE_TEXT: str = "Done"
 UNDO_TEXT: str = "Undo"
 CUSTOM_TEXT: str = "Custom"
+NEXT_PAGE_TEXT: str = "Next Page"
 
 MSG_FONT: int = 20
 MSG_WIDTH: int = 160
 
+POLL_MS: int = 5
+
+SWITCH_TEXT: str = "Select"
+SWITCH_KEYS: list[str] = ["<space>", "<Return>"]
+SWITCH_FONT: int = 45
+SCAN_HIGHLIGHT: str = "yellow"
+
+# Pooled button cell of text, value sent to callback, font size, height
+ButtonCell = tuple[str, str, int, int]
+# Scanned button and what picking it does
+ScanItem = tuple[tk.Button, Callable[[], None]]
+
 
 class GUI(tk.Tk):
     def __init__(self, comms: Communicator):
@@ -50,16 +74,39 @@ class GUI(tk.Tk):
         Starts with main window of given size. First frame inside of it is Choose Menu window, with 3 full size buttons for 3 methods
         3 frames corresponding to methods, each with Frame with grid subframe containing grid of buttons,
         textbox subframe of status/suggestions, nav buttons back/done subframe.
-
+        Letter buttons, suggestion buttons and messages are pooled per method and fonts cached per size,
+        so updates only reconfigure changed widgets instead of making new ones.
+        Communicator is evaluated on worker thread and its snapshot shown when ready, so taps never wait on it.
+        Scan method highlights rows then letters, suggestions and Done/Undo on a timer, picked with a single switch
+        of space or enter key or Select button. Its timing is logged to profile of Communicator if it has one.
+        Point method shows one page of letters at a time, likeliest letters first. Every page comes with evaluation,
+        so Next Page button turns page at once without asking Communicator.
         """
         super().__init__()
         self.comms = comms
+        self.evaluator = Evaluator(comms)
+        self.view: Optional[Evaluation] = None
+        self.smart: bool = comms.smart
+        self.done_pending: bool = False
+        self.polling: bool = False
+        self.submitted_at: float = time.perf_counter()
         self.word: str = BLANK
         self.sentence: str = BLANK
         self.letter_choice: LetterChoice = LetterChoice.GRID
-        self.word_msg: Optional[tk.Message] = None
-        self.grid_buttons: list[list[tk.Button]] = []
-        self.suggest_buttons: list[tk.Button] = []
+        self.fonts: dict[int, tk.font.Font] = {}
+        self.word_msgs: dict[LetterChoice, tk.Message] = {}
+        self.grid_buttons: dict[LetterChoice, list[list[tk.Button]]] = {}
+        self.suggest_buttons: dict[LetterChoice, list[tk.Button]] = {}
+        self.button_cells: dict[tk.Button, Optional[ButtonCell]] = {}
+        self.shown: dict[LetterChoice, tuple[Grid, list[str]]] = {}
+        self.scanner = Scanner(
+            log_path=profile_path(comms.profile) / SCAN_LOG_NAME
+            if comms.profile
+            else None
+        )
+        self.scan_job: Optional[str] = None
+        self.scan_lit: list[tk.Button] = []
+        self.page: int = 0
 
         # Main Window
         self.title(TITLE)
@@ -77,8 +124,10 @@ class GUI(tk.Tk):
         self.choose_grid.pack(side=tk.TOP)
         self.choose_gridpoint = self._gen_choose_button(text=GRIDPOINT_PROMPT)
         self.choose_gridpoint.pack(side=tk.TOP)
-        # self.choose_point = self._gen_choose_button(text=POINT_PROMPT)
-        # self.choose_point.pack(side=tk.BOTTOM)
+        self.choose_point = self._gen_choose_button(text=POINT_PROMPT)
+        self.choose_point.pack(side=tk.TOP)
+        self.choose_scan = self._gen_choose_button(text=SCAN_PROMPT)
+        self.choose_scan.pack(side=tk.TOP)
 
         # Grid Page
         self.grid_frame = tk.Frame(self)
@@ -102,14 +151,50 @@ class GUI(tk.Tk):
         self.gridpoint_suggest_frame = tk.Frame(self.gridpoint_frame)
         self.gridpoint_suggest_frame.grid(row=1, column=13, rowspan=4, columnspan=4)
 
+        # Scan Page
+        self.scan_frame = tk.Frame(self)
+        self.scan_button_frame = self._gen_nav_buttons(self.scan_frame)
+        self.scan_button_frame.grid(row=0, column=0, rowspan=5, columnspan=3)
+        self.scan_controls: list[ScanItem] = [
+            (self.done_button, self._done),
+            (self.undo_button, self._scan_undo),
+        ]
+        self.scan_letter_frame = tk.Frame(self.scan_frame)
+        self.scan_letter_frame.grid(row=0, column=3, rowspan=5, columnspan=10)
+        self.scan_word_frame = tk.Frame(self.scan_frame)
+        self.scan_word_frame.grid(row=0, column=13, rowspan=1, columnspan=4)
+        self.scan_suggest_frame = tk.Frame(self.scan_frame)
+        self.scan_suggest_frame.grid(row=1, column=13, rowspan=4, columnspan=4)
+        self.scan_switch = tk.Button(
+            self.scan_frame,
+            text=SWITCH_TEXT,
+            height=NAV_BUTTON_HEIGHT,
+            font=self._font(SWITCH_FONT),
+            command=self._scan_press,
+        )
+        self.scan_switch.grid(row=5, column=0, columnspan=17, sticky=tk.EW)
+        self.scan_background: str = self.scan_switch.cget("background")
+        for key in SWITCH_KEYS:
+            self.bind(key, self._switch_key)
+
         # Point Page
         self.point_frame = tk.Frame(self)
-        # self.point_button_frame = self._gen_nav_buttons(self.point_frame)
-        # self.point_button_frame.pack(side=NAV_BUTTON_SIDE)
-        # self.point_word_frame = tk.Frame(self.point_frame)
-        # self.point_word_frame.pack(side=OUTPUT_SIDE)
-        # self.point_letter_frame = tk.Frame(self.point_frame)
-        # self.point_letter_frame.pack()
+        self.point_button_frame = self._gen_nav_buttons(self.point_frame)
+        self.point_button_frame.grid(row=0, column=0, rowspan=5, columnspan=3)
+        self.point_letter_frame = tk.Frame(self.point_frame)
+        self.point_letter_frame.grid(row=0, column=3, rowspan=5, columnspan=10)
+        self.point_word_frame = tk.Frame(self.point_frame)
+        self.point_word_frame.grid(row=0, column=13, rowspan=1, columnspan=4)
+        self.point_suggest_frame = tk.Frame(self.point_frame)
+        self.point_suggest_frame.grid(row=1, column=13, rowspan=4, columnspan=4)
+        self.next_page_button = tk.Button(
+            self.point_frame,
+            text=NEXT_PAGE_TEXT,
+            height=NAV_BUTTON_HEIGHT,
+            font=self._font(NAV_BUTTON_FONT),
+            command=self._next_page,
+        )
+        self.next_page_button.grid(row=5, column=0, columnspan=17, sticky=tk.EW)
 
     def _choose_method(self, method: str) -> None:
         """Callback of button press in Choose Menu.
@@ -121,11 +206,13 @@ class GUI(tk.Tk):
             GRID_PROMPT.lower(): self.grid_frame,
             GRIDPOINT_PROMPT.lower(): self.gridpoint_frame,
             POINT_PROMPT.lower(): self.point_frame,
+            SCAN_PROMPT.lower(): self.scan_frame,
         }
         CHOICE_MAP = {
             GRID_PROMPT.lower(): LetterChoice.GRID,
             GRIDPOINT_PROMPT.lower(): LetterChoice.GRID_POINT,
             POINT_PROMPT.lower(): LetterChoice.POINT,
+            SCAN_PROMPT.lower(): LetterChoice.SCAN,
         }
         self.current_frame = CHOICE_INPUT[method]
         self.letter_choice = CHOICE_MAP[method]
@@ -133,28 +220,100 @@ class GUI(tk.Tk):
         self.current_frame.pack()
         self.choose_method_frame.pack_forget()
 
-    def _execute(self) -> None:
-        """Convenience method for evaluating and updating grid, updating prompt and suggestions, with word triggered by buttons."""
-        self.comms.reset_grid()
-        self.comms.eval_grid(self.word)
-        if self.letter_choice == LetterChoice.GRID:
-            self.comms.clear_grid()
-        else:
-            self.comms.reduce_grid()
-        self._update_letters()
+    def _execute(self, auto_done: bool = False, learn: str = BLANK) -> None:
+        """Convenience method for evaluating and updating grid, updating prompt and suggestions, with word triggered by buttons.
+
+        Evaluation is requested from worker thread with new generation token, then polled with after so Tk stays responsive.
+        Communicator keeps states of word prefixes, so evaluating only narrows or pops states for letters that changed.
+        Sentence so far is context for ranking suggestions, so next word can be suggested before any letter is picked.
+        Word just committed is learned into personal vocabulary first.
+        """
+        self.submitted_at = time.perf_counter()
+        self.evaluator.submit(
+            self.word, self.sentence, self.smart, self.letter_choice, auto_done, learn
+        )
+        if not self.polling:
+            self.polling = True
+            self.after(POLL_MS, self._poll)
+
+    def _poll(self) -> None:
+        """Show latest evaluation once worker finishes it, polling again until then, or show why it failed."""
+        try:
+            evaluation = self.evaluator.result()
+        except Exception as e:
+            self.polling = False
+            self._show_error(e)
+            return
+        if evaluation is None and self.evaluator.pending:
+            self.after(POLL_MS, self._poll)
+            return
+        self.polling = False
+        self._show(evaluation)
+
+    def _flush(self) -> None:
+        """Wait for latest evaluation and show it now, for replaying taps without event loop."""
+        try:
+            evaluation = self.evaluator.result(wait=True)
+        except Exception as e:
+            self._show_error(e)
+            return
+        self._show(evaluation)
+
+    def _show_error(self, error: Exception) -> None:
+        """Show why latest evaluation failed in prompt, keeping grid and suggestions last shown.
+        Shown view counts as current again, so taps are taken and next one evaluates word again."""
+        self.done_pending = False
+        if self.view is None:
+            return
+        self.view = replace(self.view, generation=self.evaluator.generation)
+        self._word_msg().configure(
+            text=f"Could not update: {error}\n\nWord So Far: {self.word}\n"
+        )
+
+    @traced("gui.show")
+    def _show(self, evaluation: Optional[Evaluation]) -> None:
+        """Update grid, prompt and suggestions from evaluation unless already shown or stale.
+        Only changes from grid and suggestions last shown in method's frame are applied, Point starts from first page.
+        If letter pick finished word, or done was pressed while evaluating, finish word now.
+        A letter pick that left no words never finishes word, so user can undo it."""
+        if evaluation is None or (
+            self.view is not None and evaluation.generation <= self.view.generation
+        ):
+            return
+        self.view = evaluation
+        if TRACER.enabled:
+            TRACER.record("gui.keystroke", self.submitted_at, time.perf_counter())
+        self.page = 0
+        grid = self._shown_grid()
+        shown_grid, shown_suggestions = self.shown.get(self.letter_choice, (None, None))
+        diff = diff_grids(shown_grid, grid, shown_suggestions, evaluation.suggestions)
+        self.shown[self.letter_choice] = (grid, evaluation.suggestions)
+        self._update_letters(diff)
         self._update_prompt()
-        self._update_suggestions()
+        if diff.suggestions is not None:
+            self._update_suggestions()
+        if self.scanning:
+            self._scan_start()
+        if self.done_pending or (
+            evaluation.auto_done and evaluation.done and evaluation.num_candidates > 0
+        ):
+            self.done_pending = False
+            self._done()
 
     def _back(self) -> None:
         """Back Button Callback when pressed will reset and update grid.
 
         Set the choose menu frame in view and forgets former frame, also clear word and sentence.
+        Done pressed while evaluating is dropped, word it was for is gone. Scanning stops until Scan is chosen again.
         """
         self.word = BLANK
         self.sentence = BLANK
-        self._execute()
+        self.done_pending = False
+        self._scan_stop()
         self.choose_method_frame.pack()
         self.current_frame.pack_forget()
+        self.current_frame = self.choose_method_frame
+        self._execute()
 
     def _suggest_done(self, add_word: str) -> None:
         """Suggestion button callback if clicked, it will automatically add word to sentence.
@@ -163,28 +322,33 @@ class GUI(tk.Tk):
         """
         self.word = BLANK
         self.sentence += f" {add_word}"
-        self._execute()
+        self._execute(learn=add_word)
 
     def _done(self) -> None:
         """Done with making single word and add word to sentence.
 
         Actual word used wither current word if possible, first option of possible words if substrign not possible, or just substring word if no possibilities.
-        Resets word, also updates message for sentence so far and resets grid for next word."""
+        Resets word, also updates message for sentence so far and resets grid for next word.
+        If current word is still being evaluated, word is finished once its evaluation is shown."""
+        view = self.view
+        if view is None or view.generation != self.evaluator.generation:
+            self.done_pending = True
+            return
         add_word = (
             self.word
-            if self.word in POSSIBLE_WORDS
-            else self.comms.filtered_words[0]
-            if len(self.comms.filtered_words) > 0
+            if view.is_word
+            else view.suggestions[0]
+            if len(view.suggestions) > 0
             else self.word
         )
         self.word = BLANK
         self.sentence += f" {add_word}"
-        self._execute()
+        self._execute(learn=add_word)
 
     def _undo(self) -> None:
         """When make erroneous addition to word, undo's it by reducing word by last character.
 
-        It must also re-evaluate last word by resetting grid, evaluating it with short word, and clear/reduce depending on method.
+        It must also re-evaluate last word with short word, which pops last prefix state, and clear/reduce depending on method.
         """
         self.word = self.word[:-1]
         self._execute()
@@ -194,22 +358,158 @@ class GUI(tk.Tk):
 
         If toggled to not smart, just forces reset, if retoggled to smart does evaluation on current word.
         """
-        self.comms.smart = not self.comms.smart
+        self.smart = not self.smart
         self._execute()
 
     def _pick_letter(self, letter: str) -> None:
         """Callback of each letter button where press of it sends corresponding letter to arg.
 
-        If not done and not empty letter picked, it will add letter to word, then run communicator.
+        If not done and not empty letter picked, it will add letter to word, then run communicator. Chunk cells add all their letters.
         For Grid mode it will clear grid, leaving empty spots on board. For others it will reduce grid for smaller size.
-        It will also check for done status if no words left and call updating the display .
+        Word is finished once evaluation shows one word left, and display updated when evaluation is ready.
+        Taps while last evaluation is not shown yet are ignored, since they were aimed at grid before it.
         """
-        if letter == EMPTY:
+        if (
+            letter == EMPTY
+            or self.view is None
+            or self.view.generation != self.evaluator.generation
+        ):
             return
         self.word += letter
-        self._execute()
-        if self.comms.done:
-            self._done()
+        self._execute(auto_done=True)
+
+    @property
+    def shown_view(self) -> Evaluation:
+        """Evaluation shown now, displays are only updated once there is one."""
+        assert self.view is not None, "No evaluation shown yet"
+        return self.view
+
+    def _shown_grid(self) -> Grid:
+        """Grid of view to show, only current page of it if view was laid out in pages for Point method."""
+        view = self.shown_view
+        if view.letter_choice != LetterChoice.POINT or not view.grid:
+            return view.grid
+        return (view.grid[self.page],)
+
+    def _next_page(self) -> None:
+        """Next Page Button Callback turning to next page of letters, back to first after last.
+        Pages are already in view, so only letters that differ from page shown are reconfigured.
+        Does nothing until a Point view is shown, since view of method before has no pages."""
+        if (
+            self.letter_choice != LetterChoice.POINT
+            or self.view is None
+            or self.view.letter_choice != LetterChoice.POINT
+            or not self.view.grid
+        ):
+            return
+        self.page = (self.page + 1) % len(self.view.grid)
+        shown_grid, shown_suggestions = self.shown[LetterChoice.POINT]
+        grid = self._shown_grid()
+        self.shown[LetterChoice.POINT] = (grid, shown_suggestions)
+        self._update_letters(diff_grids(shown_grid, grid))
+        self._update_prompt()
+
+    def _scan_items(self) -> list[list[ScanItem]]:
+        """Groups to scan, rows of letter buttons from likeliest row and letter, then suggestions, then Done/Undo."""
+        view = self.shown_view
+        buttons = self.grid_buttons[LetterChoice.SCAN]
+        letter_buttons: dict[str, tk.Button] = {}
+        for row_num, row in enumerate(view.grid):
+            vals = [val for val in row if val != EMPTY]
+            for col_num, letter in enumerate(vals):
+                letter_buttons[letter] = buttons[row_num][col_num]
+        groups: list[list[ScanItem]] = [
+            [(letter_buttons[letter], partial(self._scan_letter, letter)) for letter in group]
+            for group in scan_groups(view.grid, view.ranked_letters)
+        ]
+        groups.append(
+            [
+                (btn, partial(self._scan_suggest, suggestion))
+                for btn, suggestion in zip(
+                    self.suggest_buttons.get(LetterChoice.SCAN, []),
+                    view.suggestions,
+                )
+            ]
+        )
+        groups.append(self.scan_controls)
+        return groups
+
+    @property
+    def scanning(self) -> bool:
+        """Whether Scan method frame is showing, scan timer and switch only run while it is."""
+        return self.current_frame is self.scan_frame
+
+    def _scan_start(self) -> None:
+        """Scan groups of grid just shown from the start."""
+        self.scanner.start(self._scan_items())
+        self._scan_highlight()
+        self._scan_schedule()
+
+    def _scan_schedule(self) -> None:
+        """Move highlight on after dwell, unless scanning paused."""
+        if self.scan_job is not None:
+            self.after_cancel(self.scan_job)
+        self.scan_job = (
+            None
+            if self.scanner.paused
+            else self.after(int(self.scanner.dwell), self._scan_tick)
+        )
+
+    def _scan_tick(self) -> None:
+        """Timer callback moving highlight to next group or item."""
+        self.scan_job = None
+        self.scanner.advance()
+        self._scan_highlight()
+        self._scan_schedule()
+
+    def _scan_highlight(self) -> None:
+        """Highlight buttons scanner has highlighted, restoring ones that were."""
+        for btn in self.scan_lit:
+            btn.configure(background=self.scan_background)
+        self.scan_lit = [btn for btn, _ in self.scanner.highlighted]
+        for btn in self.scan_lit:
+            btn.configure(background=SCAN_HIGHLIGHT)
+
+    def _scan_stop(self) -> None:
+        """Stop timer and clear highlight, until next evaluation is shown."""
+        if self.scan_job is not None:
+            self.after_cancel(self.scan_job)
+            self.scan_job = None
+        self.scanner.start([])
+        self._scan_highlight()
+
+    def _scan_press(self) -> None:
+        """Switch press in Scan method. Picking a group scans its items, picking an item does what its button does
+        and scanning waits for evaluation of it. Does nothing unless Scan method frame is showing."""
+        if not self.scanning:
+            return
+        item = self.scanner.press()
+        if item is None:
+            self._scan_highlight()
+            self._scan_schedule()
+            return
+        self._scan_stop()
+        _, action = item
+        action()
+
+    def _switch_key(self, _event: tk.Event) -> None:
+        """Key bound as switch, only pressing it while Scan method frame is showing."""
+        self._scan_press()
+
+    def _scan_letter(self, letter: str) -> None:
+        """Pick scanned letter or chunk, counting its letters toward throughput."""
+        self.scanner.record_chars(len(letter))
+        self._pick_letter(letter)
+
+    def _scan_suggest(self, suggestion: str) -> None:
+        """Pick scanned suggestion, counting letters it added and space toward throughput."""
+        self.scanner.record_chars(max(len(suggestion) - len(self.word), 0) + 1)
+        self._suggest_done(suggestion)
+
+    def _scan_undo(self) -> None:
+        """Undo scanned letter, counting it against throughput."""
+        self.scanner.record_error()
+        self._undo()
 
     def _gen_choose_button(self, text: str) -> tk.Button:
         """Method to form choose menu button to reduce repeatable code.
@@ -222,7 +522,7 @@ class GUI(tk.Tk):
             text=text,
             width=CHOOSE_BUTTON_WIDTH,
             height=CHOOSE_BUTTON_HEIGHT,
-            font=tk.font.Font(size=CHOOSE_BUTTON_FONT),
+            font=self._font(CHOOSE_BUTTON_FONT),
             command=partial(self._choose_method, text.lower()),
         )
 
@@ -234,7 +534,7 @@ class GUI(tk.Tk):
             text=DONE_TEXT,
             width=NAV_BUTTON_WIDTH,
             height=NAV_BUTTON_HEIGHT,
-            font=tk.font.Font(size=NAV_BUTTON_FONT),
+            font=self._font(NAV_BUTTON_FONT),
             command=self._done,
         )
         self.done_button.grid(row=0, column=0)
@@ -243,7 +543,7 @@ class GUI(tk.Tk):
             text=UNDO_TEXT,
             width=NAV_BUTTON_WIDTH,
             height=NAV_BUTTON_HEIGHT,
-            font=tk.font.Font(size=NAV_BUTTON_FONT),
+            font=self._font(NAV_BUTTON_FONT),
             command=self._undo,
         )
         self.undo_button.grid(row=1, column=0)
@@ -252,7 +552,7 @@ class GUI(tk.Tk):
             text=CUSTOM_TEXT,
             width=NAV_BUTTON_WIDTH,
             height=NAV_BUTTON_HEIGHT,
-            font=tk.font.Font(size=NAV_BUTTON_FONT),
+            font=self._font(NAV_BUTTON_FONT),
             command=self._custom,
         )
         self.custom_button.grid(row=2, column=0)
@@ -261,103 +561,180 @@ class GUI(tk.Tk):
             text=BACK_TEXT,
             width=NAV_BUTTON_WIDTH,
             height=NAV_BUTTON_HEIGHT,
-            font=tk.font.Font(size=NAV_BUTTON_FONT),
+            font=self._font(NAV_BUTTON_FONT),
             command=self._back,
         )
         self.back_button.grid(row=3, column=0)
 
         return self.button_frame
 
-    def _update_letters(self) -> None:
-        """Function that adds buttons to grid subframe object of given choose method frame used for selecting letters
-
-        It finds which choice frame the gird is applied to using choose method, then forget old buttons in frame if they exist.
-        It then creates new buttons, one for each letter in grid object. If Grid keeps empty buttons, else doesn't add them.
-        Finally, re-puts the new buttons into a grid.
+    def _font(self, size: int) -> tk.font.Font:
+        """Get font of given size, making it only first time size is used."""
+        if size not in self.fonts:
+            self.fonts[size] = tk.font.Font(size=size)
+        return self.fonts[size]
+
+    def _pool_button(
+        self,
+        frame: tk.Frame,
+        row: int,
+        col: int,
+        width: int,
+        command: Callable[[str], None],
+    ) -> tk.Button:
+        """Make pooled button placed in frame grid cell, hidden until update gives it a cell.
+        Its Tcl command is registered once here and sends value of whatever cell button shows,
+        so reconfiguring it never registers another one."""
+        btn = tk.Button(frame, width=width)
+        btn.configure(command=partial(self._press_pooled, btn, command))
+        btn.grid(row=row, column=col)
+        btn.grid_remove()
+        self.button_cells[btn] = None
+        return btn
+
+    def _press_pooled(self, btn: tk.Button, command: Callable[[str], None]) -> None:
+        """Pooled button callback sending value of cell button shows, nothing if it shows none."""
+        cell = self.button_cells[btn]
+        if cell is not None:
+            command(cell[1])
+
+    def _update_button(self, btn: tk.Button, cell: Optional[ButtonCell]) -> None:
+        """Reconfigure pooled button only if its cell changed. No cell hides it, keeping its grid place to show it again."""
+        if self.button_cells[btn] == cell:
+            return
+        if cell is None:
+            btn.grid_remove()
+        else:
+            text, _, font_size, height = cell
+            btn.configure(
+                text=text,
+                font=self._font(font_size),
+                height=height,
+            )
+            if self.button_cells[btn] is None:
+                btn.grid()
+        self.button_cells[btn] = cell
+
+    @traced("gui.update_letters")
+    def _update_letters(self, diff: GridDiff) -> None:
+        """Function that updates pooled buttons of grid subframe object of given choose method frame used for selecting letters
+
+        It finds which choice frame the gird is applied to using choose method, then makes its pool of buttons for biggest grid if not made yet.
+        Then only rows diff changed are redrawn, every row if grid was resized.
+        Each letter in changed row goes to button in same row. If Grid keeps empty buttons, else doesn't add them.
+        Point shows only its current page, in first row.
+        Finally, only buttons whose letter changed are reconfigured, and buttons without letters hidden.
         """
         FRAME_MAP = {
             LetterChoice.GRID: self.grid_letter_frame,
             LetterChoice.GRID_POINT: self.gridpoint_letter_frame,
-            LetterChoice.POINT: self.point_frame,
+            LetterChoice.POINT: self.point_letter_frame,
+            LetterChoice.SCAN: self.scan_letter_frame,
         }
         frame = FRAME_MAP[self.letter_choice]
-        for row in self.grid_buttons:
-            for btn in row:
-                btn.grid_forget()
-        self.grid_buttons = [
-            [
-                tk.Button(
-                    frame,
-                    width=LETTER_WIDTH,
-                    height=LETTER_HEIGHT,
-                    font=tk.font.Font(size=int(LETTER_BUTTON_FONT / len(row))),
-                    text=val.upper(),
-                    command=partial(self._pick_letter, val),
-                )
+        if self.letter_choice not in self.grid_buttons:
+            self.grid_buttons[self.letter_choice] = [
+                [
+                    self._pool_button(
+                        frame, row_num, col_num, LETTER_WIDTH, self._pick_letter
+                    )
+                    for col_num in range(MAX_COLS)
+                ]
+                for row_num in range(MAX_ROWS)
+            ]
+        grid = self._shown_grid()
+        for row_num in range(MAX_ROWS) if diff.resized else diff.rows:
+            row_buttons = self.grid_buttons[self.letter_choice][row_num]
+            row = grid[row_num] if row_num < len(grid) else ()
+            vals = [
+                val
                 for val in row
                 if val != EMPTY or self.letter_choice == LetterChoice.GRID
             ]
-            for row in self.comms.remain_grid
-        ]
-
-        for row_num, row in enumerate(self.grid_buttons):
-            for col_num, btn in enumerate(row):
-                btn.grid(row=row_num, column=col_num)
+            for col_num, btn in enumerate(row_buttons):
+                cell = (
+                    (
+                        vals[col_num].upper(),
+                        vals[col_num],
+                        int(LETTER_BUTTON_FONT / len(row)),
+                        LETTER_HEIGHT,
+                    )
+                    if col_num < len(vals)
+                    else None
+                )
+                self._update_button(btn, cell)
 
+    @traced("gui.update_suggestions")
     def _update_suggestions(self, force_suggestions: Optional[list[str]] = None):
-        """From given suggestions of smart algorithm, create buttons for each.
+        """From given suggestions of smart algorithm, update pooled button for each.
 
-        It finds which choice frame the gird is applied to using choose method, then forget old suggestions in frame if they exists.
-        Then adds current suggestions.
+        It finds which choice frame the gird is applied to using choose method, then makes its pool of suggestion buttons if not made yet.
+        Then puts current suggestions on buttons, hiding the rest.
         """
         FRAME_MAP = {
             LetterChoice.GRID: self.grid_suggest_frame,
             LetterChoice.GRID_POINT: self.gridpoint_suggest_frame,
-            LetterChoice.POINT: self.point_frame,
+            LetterChoice.POINT: self.point_suggest_frame,
+            LetterChoice.SCAN: self.scan_suggest_frame,
         }
         frame = FRAME_MAP[self.letter_choice]
-        for btn in self.suggest_buttons:
-            btn.grid_forget()
-        suggestions = self.comms.filtered_words[:MAX_SUGGESTIONS]
+        if self.letter_choice not in self.suggest_buttons:
+            self.suggest_buttons[self.letter_choice] = [
+                self._pool_button(
+                    frame, row_num, 0, SUGGEST_WIDTH, self._suggest_done
+                )
+                for row_num in range(MAX_SUGGESTIONS)
+            ]
+        suggestions = self.shown_view.suggestions
         if force_suggestions is not None:
             suggestions = force_suggestions
-        self.suggest_buttons = [
-            tk.Button(
-                frame,
-                width=SUGGEST_WIDTH,
-                height=int(SUGGEST_HEIGHT * MAX_SUGGESTIONS / len(suggestions)),
-                font=tk.font.Font(size=SUGGEST_BUTTON_FONT),
-                text=suggestion,
-                command=partial(self._suggest_done, suggestion),
+        for row_num, btn in enumerate(self.suggest_buttons[self.letter_choice]):
+            cell = (
+                (
+                    suggestions[row_num],
+                    suggestions[row_num],
+                    SUGGEST_BUTTON_FONT,
+                    int(SUGGEST_HEIGHT * MAX_SUGGESTIONS / len(suggestions)),
+                )
+                if row_num < len(suggestions)
+                else None
             )
-            for suggestion in suggestions
-        ]
+            self._update_button(btn, cell)
 
-        for row_num, btn in enumerate(self.suggest_buttons):
-            btn.grid(row=row_num, column=0)
+    def _word_msg(self) -> tk.Message:
+        """Prompt message of choice frame of choose method, made if not made yet."""
+        FRAME_MAP = {
+            LetterChoice.GRID: self.grid_word_frame,
+            LetterChoice.GRID_POINT: self.gridpoint_word_frame,
+            LetterChoice.POINT: self.point_word_frame,
+            LetterChoice.SCAN: self.scan_word_frame,
+        }
+        if self.letter_choice not in self.word_msgs:
+            self.word_msgs[self.letter_choice] = tk.Message(
+                FRAME_MAP[self.letter_choice], font=self._font(MSG_FONT), width=MSG_WIDTH
+            )
+            self.word_msgs[self.letter_choice].pack()
+        return self.word_msgs[self.letter_choice]
 
+    @traced("gui.update_prompt")
     def _update_prompt(self, force_text: Optional[str] = None) -> str:
         """Fuction that updates display prompt with current word created, word suggestions list, and if final word.
 
-        It finds which choice frame the gird is applied to using choose method, then forget old message in frame if it exists.
-        Then adds current word and sentence.
+        It finds message of choice frame the gird is applied to, then updates its text with current word and sentence if it changed.
         """
-        FRAME_MAP = {
-            LetterChoice.GRID: self.grid_word_frame,
-            LetterChoice.GRID_POINT: self.gridpoint_word_frame,
-            LetterChoice.POINT: self.point_frame,
-        }
-        frame = FRAME_MAP[self.letter_choice]
-        if self.word_msg:
-            self.word_msg.pack_forget()
-        display = f"Custom Mode: {'Off' if self.comms.smart else 'On'}\n"
-        display += f"Sentence so far: {self.sentence}\n\n"
-        display += f"Word So Far: {self.word}\n\n"
-        self.word_msg = tk.Message(
-            frame,
-            text=force_text if force_text is not None else display,
-            font=tk.font.Font(size=MSG_FONT),
-            width=MSG_WIDTH,
-        )
-        self.word_msg.pack()
+        view = self.shown_view
+        display = f"Custom Mode: {'Off' if view.smart else 'On'}\n"
+        display += f"Sentence so far: {view.sentence}\n\n"
+        display += f"Word So Far: {view.word}\n\n"
+        if self.letter_choice == LetterChoice.SCAN:
+            display += f"Scan: {self.scanner.dwell / 1000:.1f}s"
+            if self.scanner.last_cpm is not None:
+                display += f", {self.scanner.last_cpm:.0f} chars/min"
+            display += "\n"
+        if view.letter_choice == LetterChoice.POINT and view.grid:
+            display += f"Page {self.page + 1} of {len(view.grid)}\n"
+        text = force_text if force_text is not None else display
+        word_msg = self._word_msg()
+        if word_msg.cget("text") != text:
+            word_msg.configure(text=text)
         return display
@@ -0,0 +1,30 @@
+from functools import lru_cache
+
+from communicate.constants import EMPTY, LAYOUT_CACHE_SIZE
+from communicate.make_grid import Grid
+
+
+@lru_cache(maxsize=None)
+def cell_order(num_rows: int, num_cols: int) -> tuple[tuple[int, int], ...]:
+    """Cells of grid from least to most pointing distance, row plus column from top left, then lower row first.
+    Placing letters from most to least likely in this order minimizes expected distance to pick a letter."""
+    return tuple(
+        sorted(
+            ((row, col) for row in range(num_rows) for col in range(num_cols)),
+            key=lambda cell: (cell[0] + cell[1], cell[0]),
+        )
+    )
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def optimal_grid(num_rows: int, num_cols: int, ranked_letters: tuple[str, ...]) -> Grid:
+    """Immutable grid with letters ranked most likely first placed in cells of least pointing distance, rest empty.
+    Filled cells of each row stay at its start, so reducing row by empty spaces keeps letter order.
+    Cached by dimensions and ranking so each layout is only built once and shared."""
+    if num_rows == 0 or num_cols == 0:
+        return ((EMPTY,),)
+    grid = [[EMPTY for _ in range(num_cols)] for _ in range(num_rows)]
+    for letter, (row, col) in zip(ranked_letters, cell_order(num_rows, num_cols)):
+        grid[row][col] = letter
+    return tuple(tuple(row) for row in grid)
+
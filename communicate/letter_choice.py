@@ -7,3 +7,4 @@ class LetterChoice(Enum):
     GRID = auto()
     GRID_POINT = auto()
     POINT = auto()
+    SCAN = auto()
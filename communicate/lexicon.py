@@ -0,0 +1,220 @@
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import ItemsView, Mapping, Sequence
+from pathlib import Path
+from typing import Iterator, Literal, Optional
+
+from communicate.constants import LEXICON_PATH
+
+# LEXICON FILE VALUES
+LEXICON_MAGIC: bytes = b"CMLX"
+LEXICON_VERSION: int = 1
+HEADER_FORMAT: str = "<4sIII"
+HEADER_SIZE: int = struct.calcsize(HEADER_FORMAT)
+# Sorts after every letter, so prefix + it bounds range of words starting with prefix
+PREFIX_END: str = "\x7f"
+
+
+def array_view(raw: memoryview, typecode: Literal["I", "Q"]):
+    """View little endian bytes as array of unsigned typecode in place, only copying to swap bytes on big endian machines."""
+    if sys.byteorder == "little":
+        return raw.cast(typecode)
+    values = array(typecode, raw.tobytes())
+    values.byteswap()
+    return values
+
+
+def little_endian(values: array) -> bytes:
+    """Bytes of array in little endian order for writing to file."""
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class LexiconWords(Sequence):
+    """Sorted words of lexicon as read only sequence, decoding each word only when indexed, so it can be bisected."""
+
+    __slots__ = ("_lexicon",)
+
+    def __init__(self, lexicon: "Lexicon"):
+        """View over words of lexicon."""
+        self._lexicon = lexicon
+
+    def __len__(self) -> int:
+        """Number of words in lexicon."""
+        return len(self._lexicon)
+
+    def __getitem__(self, idx):
+        """Word at index, or list of words of slice."""
+        if isinstance(idx, slice):
+            return [self._lexicon.word(pos) for pos in range(len(self))[idx]]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("lexicon index out of range")
+        return self._lexicon.word(idx)
+
+
+class LexiconItems(ItemsView):
+    """Items view walking lexicon in order instead of looking up each word."""
+
+    __slots__ = ("_lexicon",)
+
+    def __init__(self, lexicon: "Lexicon"):
+        """Items view over lexicon."""
+        super().__init__(lexicon)
+        self._lexicon = lexicon
+
+    def __iter__(self) -> Iterator[tuple[str, int]]:
+        """Yields each word and its count in alphabetical order."""
+        lexicon = self._lexicon
+        for idx in range(len(lexicon)):
+            yield lexicon.word(idx), lexicon.count(idx)
+
+
+class Lexicon(Mapping):
+    """Read only word table and counts memory mapped from compiled lexicon file, used as mapping of word to count.
+
+    File is header (magic, version, number of words, size of word bytes), then little endian uint32 word offsets,
+    uint32 counts and the words joined into one ascii byte string. Words are sorted alphabetically.
+    Words are only turned into strings when asked for, so loading costs no per word objects and every
+    Communicator reading it shares the same mapped pages. Looking up a word or prefix bisects sorted words.
+    """
+
+    __slots__ = ("path", "words", "_file", "_buffer", "_offsets", "_counts", "_blob_start")
+
+    def __init__(self, path: Path):
+        """Map file and check header before making views over offsets, counts and word bytes."""
+        self.path = path
+        self._file = open(path, "rb")
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, num_words, blob_size = struct.unpack_from(
+            HEADER_FORMAT, self._buffer
+        )
+        if magic != LEXICON_MAGIC:
+            raise ValueError(f"{path} is not a lexicon file")
+        if version != LEXICON_VERSION:
+            raise ValueError(
+                f"{path} is lexicon version {version}, expected {LEXICON_VERSION}, rebuild it"
+            )
+        view = memoryview(self._buffer)
+        counts_start = HEADER_SIZE + 4 * (num_words + 1)
+        blob_start = counts_start + 4 * num_words
+        self._offsets = array_view(view[HEADER_SIZE:counts_start], "I")
+        self._counts = array_view(view[counts_start:blob_start], "I")
+        self._blob_start = blob_start
+        self.words: LexiconWords = LexiconWords(self)
+
+    def __enter__(self) -> "Lexicon":
+        """Lexicon itself, closed when block ends."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close lexicon at end of block."""
+        self.close()
+
+    def close(self) -> None:
+        """Release views over mapped file, then unmap and close it, so file can be removed. Lexicon can not be read after."""
+        for values in (self._offsets, self._counts):
+            if isinstance(values, memoryview):
+                values.release()
+        self._buffer.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        """Number of words in lexicon."""
+        return len(self._counts)
+
+    def __iter__(self) -> Iterator[str]:
+        """Words in alphabetical order."""
+        for idx in range(len(self)):
+            yield self.word(idx)
+
+    def __getitem__(self, word: str) -> int:
+        """Count of word, KeyError if not in lexicon."""
+        idx = self.index(word)
+        if idx is None:
+            raise KeyError(word)
+        return self.count(idx)
+
+    def __contains__(self, word: object) -> bool:
+        """Whether word is in lexicon, by bisecting instead of hashing."""
+        return isinstance(word, str) and self.index(word) is not None
+
+    @property
+    def counts(self) -> Sequence[int]:
+        """Counts of words in alphabetical order, read in place from mapped file."""
+        return self._counts
+
+    def bisect_left(self, word: str, start: int = 0, end: Optional[int] = None) -> int:
+        """First index in start:end where word would go in sorted table.
+        Compares bytes sliced straight from mapped file, so no word strings are made while searching."""
+        key = word.encode("ascii", "ignore")
+        offsets, buffer, base = self._offsets, self._buffer, self._blob_start
+        low, high = start, len(self) if end is None else end
+        while low < high:
+            mid = (low + high) // 2
+            if buffer[base + offsets[mid] : base + offsets[mid + 1]] < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def index(self, word: str) -> Optional[int]:
+        """Index of word in sorted table, None if not a word."""
+        idx = self.bisect_left(word)
+        if idx < len(self) and self.word(idx) == word:
+            return idx
+        return None
+
+    def word(self, idx: int) -> str:
+        """Word at index of alphabetically sorted table."""
+        base = self._blob_start
+        return self._buffer[
+            base + self._offsets[idx] : base + self._offsets[idx + 1]
+        ].decode()
+
+    def count(self, idx: int) -> int:
+        """Count in corpus of word at index."""
+        return self._counts[idx]
+
+    def items(self) -> LexiconItems:
+        """Each word and its count in alphabetical order."""
+        return LexiconItems(self)
+
+
+def write_lexicon(path: Path, frequency_map: dict[str, int]) -> Path:
+    """Write frequency map to lexicon file, sorting words so lexicon can be used as a sorted word table.
+    Write to temporary file first so a running reader never sees half written file."""
+    words = sorted(frequency_map)
+    blob = "".join(words).encode("ascii")
+    offsets = array("I", [0])
+    for word in words:
+        offsets.append(offsets[-1] + len(word))
+    counts = array("I", [frequency_map[word] for word in words])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as out_file:
+        out_file.write(
+            struct.pack(
+                HEADER_FORMAT, LEXICON_MAGIC, LEXICON_VERSION, len(words), len(blob)
+            )
+        )
+        out_file.write(little_endian(offsets))
+        out_file.write(little_endian(counts))
+        out_file.write(blob)
+    tmp_path.replace(path)
+    return path
+
+
+def load_lexicon(path: Path = LEXICON_PATH) -> Lexicon:
+    """Load compiled lexicon. It is never built here, since building downloads corpora,
+    so a missing file raises FileNotFoundError saying how to build it."""
+    if not path.exists():
+        raise FileNotFoundError(
+            f"No compiled lexicon at {path}, build it with `communicate build-lexicon` and copy it to offline machines"
+        )
+    return Lexicon(path)
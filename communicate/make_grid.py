@@ -1,4 +1,9 @@
-from communicate.constants import ALPHABET, EMPTY, MAX_COLS, MAX_ROWS
+from functools import lru_cache
+
+from communicate.constants import ALPHABET, EMPTY, LAYOUT_CACHE_SIZE, MAX_COLS, MAX_ROWS
+
+# Immutable grid shared between caches and displays
+Grid = tuple[tuple[str, ...], ...]
 
 
 def make_grid(
@@ -21,3 +26,9 @@ def make_grid(
         [out_letters[row * num_cols + col] for col in range(num_cols)]
         for row in range(num_rows)
     ]
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def frozen_grid(num_rows: int, num_cols: int, letters: tuple[str, ...]) -> Grid:
+    """Immutable grid of make_grid, cached by dimensions and letters so each layout is only built once and shared."""
+    return tuple(tuple(row) for row in make_grid(num_rows, num_cols, list(letters)))
@@ -0,0 +1,121 @@
+import mmap
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Optional
+
+from communicate.constants import NGRAM_PATH
+from communicate.lexicon import array_view, little_endian
+
+# NGRAM FILE VALUES
+NGRAM_MAGIC: bytes = b"CMNG"
+NGRAM_VERSION: int = 1
+HEADER_FORMAT: str = "<4sIII"
+HEADER_SIZE: int = struct.calcsize(HEADER_FORMAT)
+
+
+class NgramModel:
+    """Read only ngram counts memory mapped from compiled ngram file, one table per context length.
+
+    Words are ids of alphabetically sorted lexicon, so words starting with a prefix are one id range.
+    File is header (magic, version, number of lexicon words, number of tables) then uint32 size of each table.
+    Each table is sorted uint64 context keys (context word ids as digits of base number of words),
+    parallel uint32 next word ids sorted within each context and uint32 counts.
+    Words following a context that start with a prefix are therefore two bisects away.
+    """
+
+    __slots__ = ("path", "num_words", "_file", "_buffer", "_tables")
+
+    def __init__(self, path: Path, num_words: int):
+        """Map file, checking header and that it was built from lexicon of num_words words."""
+        self.path = path
+        self.num_words = num_words
+        self._file = open(path, "rb")
+        self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, lexicon_words, num_tables = struct.unpack_from(
+            HEADER_FORMAT, self._buffer
+        )
+        if magic != NGRAM_MAGIC:
+            raise ValueError(f"{path} is not an ngram file")
+        if version != NGRAM_VERSION or lexicon_words != num_words:
+            raise ValueError(f"{path} does not match lexicon, rebuild it")
+        view = memoryview(self._buffer)
+        start = HEADER_SIZE + 4 * num_tables
+        sizes = array_view(view[HEADER_SIZE:start], "I")
+        self._tables = []
+        for size in sizes:
+            keys_end = start + 8 * size
+            nexts_end = keys_end + 4 * size
+            counts_end = nexts_end + 4 * size
+            self._tables.append(
+                (
+                    array_view(view[start:keys_end], "Q"),
+                    array_view(view[keys_end:nexts_end], "I"),
+                    array_view(view[nexts_end:counts_end], "I"),
+                )
+            )
+            start = counts_end
+
+    def context_key(self, context: tuple[int, ...]) -> int:
+        """Key of context word ids in its table."""
+        key = 0
+        for word_id in context:
+            key = key * self.num_words + word_id
+        return key
+
+    def successors(
+        self, context: tuple[int, ...], start: int, end: int
+    ) -> list[tuple[int, int]]:
+        """Word ids in start:end range seen after context with their counts, most common first."""
+        if not 0 < len(context) <= len(self._tables):
+            return []
+        keys, nexts, counts = self._tables[len(context) - 1]
+        key = self.context_key(context)
+        low = bisect_left(keys, key)
+        high = bisect_right(keys, key, low)
+        low = bisect_left(nexts, start, low, high)
+        high = bisect_left(nexts, end, low, high)
+        return sorted(
+            ((nexts[idx], counts[idx]) for idx in range(low, high)),
+            key=lambda x: (-x[1], x[0]),
+        )
+
+
+def write_ngrams(
+    path: Path, num_words: int, ngram_counts: list[dict[tuple[int, ...], int]]
+) -> Path:
+    """Write ngram counts of word id tuples to ngram file, one table per ngram length starting from bigrams.
+    Tables sorted by context key then next word id."""
+    tables = []
+    for ngrams in ngram_counts:
+        keys, nexts, counts = array("Q"), array("I"), array("I")
+        for ngram in sorted(ngrams):
+            key = 0
+            for word_id in ngram[:-1]:
+                key = key * num_words + word_id
+            keys.append(key)
+            nexts.append(ngram[-1])
+            counts.append(ngrams[ngram])
+        tables.append((keys, nexts, counts))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as out_file:
+        out_file.write(
+            struct.pack(
+                HEADER_FORMAT, NGRAM_MAGIC, NGRAM_VERSION, num_words, len(tables)
+            )
+        )
+        out_file.write(little_endian(array("I", [len(keys) for keys, _, _ in tables])))
+        for table in tables:
+            for values in table:
+                out_file.write(little_endian(values))
+    tmp_path.replace(path)
+    return path
+
+
+def load_ngrams(num_words: int, path: Path = NGRAM_PATH) -> Optional[NgramModel]:
+    """Load compiled ngram model if it was built, else None so context prediction is just skipped."""
+    if not path.exists():
+        return None
+    return NgramModel(path, num_words)
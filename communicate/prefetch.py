@@ -0,0 +1,56 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from communicate.constants import PREFETCH_SIZE
+from communicate.prefix_state import PrefixState
+
+
+@dataclass
+class StatePrefetcher:
+    """Bounded cache of prefix states made speculatively on one background thread while user is choosing next letter.
+
+    States are keyed by word, oldest dropped past size. Picking a letter takes its state, waiting only if it is being made now.
+    A state still queued behind others is cancelled instead, since making it inline is quicker than waiting for the queue.
+    Each round cancels states of earlier round not yet started, so worker always works on letters of current grid.
+    """
+
+    size: int = PREFETCH_SIZE
+
+    def __post_init__(self) -> None:
+        """Start single worker thread so prefetching never takes more than one core from GUI."""
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self._futures: OrderedDict[str, Future] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def prefetch(self, builds: dict[str, Callable[[], PrefixState]]) -> None:
+        """Start new round making state of each word in given order, skipping words already made or being made."""
+        for word, future in list(self._futures.items()):
+            if future.cancel():
+                del self._futures[word]
+        for word, build in builds.items():
+            if word in self._futures:
+                self._futures.move_to_end(word)
+                continue
+            self._futures[word] = self._executor.submit(build)
+        while len(self._futures) > self.size:
+            _, future = self._futures.popitem(last=False)
+            future.cancel()
+
+    def take(self, word: str) -> Optional[PrefixState]:
+        """Prefetched state of word, removed from cache as it goes on Communicator stack.
+        None if never prefetched or not started yet, so caller makes it itself."""
+        future = self._futures.pop(word, None)
+        if future is None or future.cancel() or future.cancelled():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return future.result()
+
+    def clear(self) -> None:
+        """Drop every prefetched state, cancelling ones not yet started."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
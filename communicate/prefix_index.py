@@ -0,0 +1,209 @@
+import heapq
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Optional
+
+from communicate.constants import (
+    ALPHABET,
+    BLANK,
+    CHUNK_MIN_SHARE,
+    MAX_CHUNK_LENGTH,
+    MAX_SUGGESTIONS,
+)
+from communicate.lexicon import Lexicon
+
+
+@dataclass
+class PrefixNode:
+    """Node of prefix index for every word starting with prefix.
+
+    Words sharing a prefix are contiguous in the sorted word table, so node only keeps its start:end range,
+    the count of each next letter, its most common words and the ranges of the child nodes, which are made when first walked into.
+    """
+
+    prefix: str
+    start: int
+    end: int
+    next_letter_count: dict[str, int] = field(default_factory=dict)
+    top_words: list[str] = field(default_factory=list)
+    child_ranges: dict[str, tuple[int, int]] = field(default_factory=dict)
+    children: dict[str, "PrefixNode"] = field(default_factory=dict)
+
+    @property
+    def num_words(self) -> int:
+        """Number of words starting with prefix."""
+        return self.end - self.start
+
+
+@dataclass
+class PrefixIndex:
+    """Sorted array range index over lexicon, built once so prefix lookups do not scan the vocabulary."""
+
+    lexicon: Lexicon
+
+    def __post_init__(self) -> None:
+        """Use lexicon's sorted words and parallel counts in place, keeping running count totals in an array
+        so any range total is one subtraction. Also build tree of most common word index per segment
+        so most common words of any range take log time."""
+        self.words: Sequence[str] = self.lexicon.words
+        self.counts: Sequence[int] = self.lexicon.counts
+        self.cum_counts: array = array("Q", accumulate(self.counts, initial=0))
+        self._build_max_tree()
+        self.root: PrefixNode = self._make_node(BLANK, 0, len(self.words))
+        self._letters_by_count: Optional[tuple[str, ...]] = None
+
+    def _build_max_tree(self) -> None:
+        """Segment tree where each node holds index of most common word in its segment, -1 for padding leaves."""
+        self.tree_size: int = 1
+        while self.tree_size < len(self.words):
+            self.tree_size *= 2
+        self.max_tree: array = array("i", [-1]) * (2 * self.tree_size)
+        for idx in range(len(self.words)):
+            self.max_tree[self.tree_size + idx] = idx
+        for pos in range(self.tree_size - 1, 0, -1):
+            self.max_tree[pos] = self._more_common(
+                self.max_tree[2 * pos], self.max_tree[2 * pos + 1]
+            )
+
+    def _more_common(self, first: int, second: int) -> int:
+        """Index of more common word, ties go to alphabetically first word and -1 always loses."""
+        if first < 0 or second < 0:
+            return max(first, second)
+        if self.counts[second] > self.counts[first] or (
+            self.counts[second] == self.counts[first] and second < first
+        ):
+            return second
+        return first
+
+    def _most_common(self, start: int, end: int) -> int:
+        """Index of most common word in start:end range, walking segment tree bottom up."""
+        best = -1
+        low, high = start + self.tree_size, end + self.tree_size
+        while low < high:
+            if low & 1:
+                best = self._more_common(best, self.max_tree[low])
+                low += 1
+            if high & 1:
+                high -= 1
+                best = self._more_common(best, self.max_tree[high])
+            low //= 2
+            high //= 2
+        return best
+
+    def top_words(self, start: int, end: int, num: int = MAX_SUGGESTIONS) -> list[str]:
+        """Most common words of range without copying it. Take most common word of a range,
+        then split range around it into two ranges to search, keeping ranges in heap by their most common word."""
+        top: list[str] = []
+        ranges: list[tuple[int, int, int, int]] = []
+
+        def push(low: int, high: int) -> None:
+            if high > low:
+                idx = self._most_common(low, high)
+                heapq.heappush(ranges, (-self.counts[idx], idx, low, high))
+
+        push(start, end)
+        while ranges and len(top) < num:
+            _, idx, low, high = heapq.heappop(ranges)
+            top.append(self.words[idx])
+            push(low, idx)
+            push(idx + 1, high)
+        return top
+
+    def _make_node(self, prefix: str, start: int, end: int) -> PrefixNode:
+        """Make node for prefix range. Child ranges come from bisecting range for each next letter,
+        letter count is total count of words in child range."""
+        node = PrefixNode(
+            prefix=prefix, start=start, end=end, top_words=self.top_words(start, end)
+        )
+        node.child_ranges = self._letter_ranges(prefix, start, end)
+        node.next_letter_count = {
+            letter: self._range_count(low, high)
+            for letter, (low, high) in node.child_ranges.items()
+        }
+        return node
+
+    def _letter_ranges(
+        self, prefix: str, start: int, end: int
+    ) -> dict[str, tuple[int, int]]:
+        """Range of each next letter within prefix range, only letters some word continues with."""
+        ranges: dict[str, tuple[int, int]] = {}
+        low = self.lexicon.bisect_left(prefix + ALPHABET[0], start, end)
+        for letter in ALPHABET:
+            high = self.lexicon.bisect_left(prefix + chr(ord(letter) + 1), low, end)
+            if high > low:
+                ranges[letter] = (low, high)
+            low = high
+        return ranges
+
+    def _range_count(self, start: int, end: int) -> int:
+        """Total count of words in range."""
+        return self.cum_counts[end] - self.cum_counts[start]
+
+    def chunks(
+        self,
+        node: PrefixNode,
+        num: int,
+        max_length: int = MAX_CHUNK_LENGTH,
+        min_share: float = CHUNK_MIN_SHARE,
+    ) -> list[str]:
+        """Most likely continuations of node's prefix two to max length letters long, most likely first,
+        only ones with at least min share of count of node's words.
+        Count of words continuing with a chunk never grows as chunk gets longer, so best first search from next letters
+        finds them in order, bisecting only ranges of chunks it expands and never making nodes."""
+        total = self._range_count(node.start, node.end)
+        chunks: list[str] = []
+        heap = [
+            (-node.next_letter_count[letter], letter, low, high)
+            for letter, (low, high) in node.child_ranges.items()
+        ]
+        heapq.heapify(heap)
+        while heap and len(chunks) < num:
+            count, chunk, low, high = heapq.heappop(heap)
+            if -count < min_share * total:
+                break
+            if len(chunk) > 1:
+                chunks.append(chunk)
+            if len(chunk) < max_length:
+                for letter, (start, end) in self._letter_ranges(
+                    node.prefix + chunk, low, high
+                ).items():
+                    heapq.heappush(
+                        heap, (-self._range_count(start, end), chunk + letter, start, end)
+                    )
+        return chunks
+
+    def child(self, node: PrefixNode, letter: str) -> Optional[PrefixNode]:
+        """Get child node of next letter, making it on first visit. None if no word continues with letter.
+        Set with setdefault so if prefetch thread makes same child at once, both keep the one node stored first."""
+        if letter not in node.children:
+            if letter not in node.child_ranges:
+                return None
+            start, end = node.child_ranges[letter]
+            return node.children.setdefault(
+                letter, self._make_node(node.prefix + letter, start, end)
+            )
+        return node.children[letter]
+
+    def letter_count(self) -> dict[str, int]:
+        """Count of each letter over all words, weighted by word counts."""
+        letter_count = dict.fromkeys(ALPHABET, 0)
+        for word, count in zip(self.words, self.counts):
+            for letter in word:
+                letter_count[letter] += count
+        return letter_count
+
+    def letters_by_count(self) -> tuple[str, ...]:
+        """Alphabet from most to least common letter over all words. Counted on first call only,
+        since it is a pass over every word, so every Communicator sharing index reuses it."""
+        if self._letters_by_count is None:
+            letter_count = self.letter_count()
+            self._letters_by_count = tuple(
+                sorted(ALPHABET, key=lambda x: letter_count[x], reverse=True)
+            )
+        return self._letters_by_count
+
+    def word_id(self, word: str) -> Optional[int]:
+        """Index of word in sorted word table, None if not a word."""
+        return self.lexicon.index(word)
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+
+from communicate.prefix_index import PrefixNode
+
+
+@dataclass
+class PrefixState:
+    """Evaluated state of one word prefix, kept on Communicator stack.
+
+    Adding letter narrows top state's node into new state, undo pops it, so earlier prefixes are never redone.
+    Suggestions are ranked by sentence context word ids state was made with.
+    Next letter counts and number of words are node's plus words of personal vocabulary version state was made with.
+    """
+
+    word: str
+    node: PrefixNode
+    ordered_letters: list[str]
+    suggestions: list[str]
+    next_letter_count: dict[str, int]
+    num_words: int
+    context_letter_count: dict[str, int] = field(default_factory=dict)
+    context: tuple[int, ...] = ()
+    version: int = 0
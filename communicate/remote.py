@@ -0,0 +1,94 @@
+import json
+import socket
+from dataclasses import dataclass
+from typing import Any
+
+from communicate.communicator import Communicator
+from communicate.constants import SERVER_SOCKET
+from communicate.make_grid import Grid
+from communicate.server import Address
+
+
+@dataclass
+class RemoteCommunicator(Communicator):
+    """Thin Communicator whose evaluation runs in a session of prediction server, so terminal loads no lexicon.
+
+    Evaluating calls go to server and state it answers with is kept locally,
+    so grid choosing, sizes and done are answered by Communicator's own methods without a round trip.
+    """
+
+    address: Address = str(SERVER_SOCKET)
+
+    def __post_init__(self) -> None:
+        """Connect to server, starting new session there."""
+        family = socket.AF_INET if isinstance(self.address, tuple) else socket.AF_UNIX
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        self._socket.connect(self.address)
+        self._file = self._socket.makefile("rwb")
+        if self.profile:
+            self._call("use_profile", self.profile)
+        self.reset_grid()
+
+    def _call(self, op: str, *args: Any) -> Any:
+        """Call Communicator method of session on server and take on its state. Server errors raise ValueError."""
+        request = {"op": op, "args": args, "smart": self.smart, "chunks": self.chunks}
+        self._file.write(json.dumps(request).encode() + b"\n")
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Prediction server closed session")
+        response = json.loads(line)
+        if "error" in response:
+            raise ValueError(response["error"])
+        state = response["state"]
+        self.remain_letters: list[str] = state["remain_letters"]
+        self.remain_grid: Grid = tuple(tuple(row) for row in state["remain_grid"])
+        self.suggestions: list[str] = state["suggestions"]
+        self.num_candidates: int = state["num_candidates"]
+        self.include_empty = state["include_empty"]
+        self.paged: bool = state["paged"]
+        return response["result"]
+
+    def reset_grid(self) -> None:
+        """Reset session to empty word."""
+        self._call("reset_grid")
+
+    def set_context(self, sentence: str) -> None:
+        """Use sentence as context of session."""
+        self._call("set_context", sentence)
+
+    def eval_grid(self, word: str) -> list[str]:
+        """Evaluate word in session, returning letters left."""
+        return self._call("eval_grid", word)
+
+    def clear_grid(self) -> Grid:
+        """Clear grid of session."""
+        self._call("clear_grid")
+        return self.remain_grid
+
+    def reduce_grid(self) -> Grid:
+        """Reduce grid of session."""
+        self._call("reduce_grid")
+        return self.remain_grid
+
+    def page_grid(self) -> Grid:
+        """Lay out Point pages of session."""
+        self._call("page_grid")
+        return self.remain_grid
+
+    def is_word(self, word: str) -> bool:
+        """Check word is in server's lexicon or session's personal vocabulary."""
+        return self._call("is_word", word)
+
+    def ranked_letters(self) -> list[str]:
+        """Letters left in session from most to least likely next."""
+        return self._call("ranked_letters")
+
+    def learn(self, word: str) -> None:
+        """Learn committed word into session's personal vocabulary."""
+        self._call("learn", word)
+
+    def close(self) -> None:
+        """End session."""
+        self._file.close()
+        self._socket.close()
@@ -0,0 +1,226 @@
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from communicate.constants import EMPTY
+from communicate.make_grid import Grid
+
+# SCAN VALUES
+SCAN_DWELL_MS: float = 1200.0
+SCAN_MIN_DWELL_MS: float = 400.0
+SCAN_MAX_DWELL_MS: float = 3000.0
+SCAN_STEP_MS: float = 100.0
+SCAN_MAX_CYCLES: int = 3
+SCAN_MIN_REACTION_MS: float = 120.0
+SCAN_LATENCY_ALPHA: float = 0.2
+SCAN_LATENCY_MARGIN: float = 1.5
+SCAN_WINDOW_CHARS: int = 20
+SCAN_LOG_NAME: str = "scan.log"
+
+
+def scan_groups(grid: Grid, ranked_letters: list[str]) -> list[list[str]]:
+    """Letters of each row of grid without empty cells, rows and letters in each row from most to least likely next,
+    so likeliest letters are highlighted first. Chunks come right after their first letter."""
+    rank = {letter: idx for idx, letter in enumerate(ranked_letters)}
+    rows = [
+        sorted(
+            (letter for letter in row if letter != EMPTY),
+            key=lambda letter: (rank.get(letter[0], len(rank)), len(letter)),
+        )
+        for row in grid
+    ]
+    return sorted(
+        (row for row in rows if row), key=lambda row: rank.get(row[0], len(rank))
+    )
+
+
+def scan_steps(groups: list[list[str]], letter: str) -> int:
+    """Highlights waited through to pick letter, scanning to its group then to it. Group is skipped if only one, 0 if not found."""
+    for group_num, group in enumerate(groups):
+        if letter in group:
+            return (group_num + 1 if len(groups) > 1 else 0) + group.index(letter) + 1
+    return 0
+
+
+@dataclass
+class Scanner:
+    """Single switch scanning of groups then items, with dwell adapted to user.
+
+    Groups like rows of grid are highlighted in turn, a press picks highlighted group and its items are highlighted in turn,
+    another press picks item. Passing whole group without press goes back to groups, passing every group max cycles times
+    pauses scanning until next press. Only one group skips straight to its items.
+
+    Dwell never goes below user's reaction latency, from highlight to press and smoothed, times margin.
+    Above that, dwell climbs toward best characters per minute: after each window of characters,
+    dwell keeps changing the same way if throughput rose, else turns back. Throughput only counts time spent scanning,
+    from first highlight after start or resume, not time paused or with nothing to scan like in menu.
+    Each window is logged as JSON line, and last logged dwell and latency start next session.
+    """
+
+    dwell_ms: float = SCAN_DWELL_MS
+    log_path: Optional[Path] = None
+
+    def __post_init__(self) -> None:
+        """Nothing to scan yet, so tuning window clock is stopped, resuming from log if any."""
+        self.groups: list[list[Any]] = []
+        self.group: Optional[int] = None
+        self.position: int = 0
+        self.cycles: int = 0
+        self.paused: bool = False
+        self.highlighted_at: float = time.perf_counter()
+        self.latency_ms: Optional[float] = None
+        self.direction: int = -1
+        self.last_cpm: Optional[float] = None
+        self.window_start: Optional[float] = None
+        self.window_elapsed: float = 0.0
+        self.window_chars: int = 0
+        self.window_errors: int = 0
+        self._load()
+
+    def _load(self) -> None:
+        """Start from dwell and latency of last logged window."""
+        if self.log_path is None or not self.log_path.exists():
+            return
+        lines = self.log_path.read_text().splitlines()
+        if lines:
+            last = json.loads(lines[-1])
+            self.dwell_ms = last["dwell_ms"]
+            self.latency_ms = last["latency_ms"]
+
+    @property
+    def dwell(self) -> float:
+        """Milliseconds each highlight lasts, tuned dwell but never under latency times margin, within limits."""
+        floor = SCAN_LATENCY_MARGIN * self.latency_ms if self.latency_ms else 0.0
+        return min(max(self.dwell_ms, floor, SCAN_MIN_DWELL_MS), SCAN_MAX_DWELL_MS)
+
+    @property
+    def highlighted(self) -> list[Any]:
+        """Items highlighted now, whole group while scanning groups, nothing while paused."""
+        if self.paused or not self.groups:
+            return []
+        if self.group is None:
+            return self.groups[self.position]
+        return [self.groups[self.group][self.position]]
+
+    def start(self, groups: list[list[Any]], now: Optional[float] = None) -> None:
+        """Scan new groups from first one, empty groups are skipped. Nothing to scan stops window clock."""
+        self.groups = [group for group in groups if group]
+        self._restart(now)
+
+    def _restart(self, now: Optional[float] = None) -> None:
+        """Highlight first group, or first item if only one group, running window clock if anything is highlighted."""
+        now = time.perf_counter() if now is None else now
+        self.group = 0 if len(self.groups) == 1 else None
+        self.position = 0
+        self.cycles = 0
+        self.paused = False
+        self.highlighted_at = now
+        if self.groups:
+            self._run_clock(now)
+        else:
+            self._stop_clock(now)
+
+    def _run_clock(self, now: float) -> None:
+        """Count time from now toward window, if not already."""
+        if self.window_start is None:
+            self.window_start = now
+
+    def _stop_clock(self, now: float) -> None:
+        """Stop counting time toward window, keeping time counted so far."""
+        if self.window_start is not None:
+            self.window_elapsed += now - self.window_start
+            self.window_start = None
+
+    def _window_seconds(self, now: float) -> float:
+        """Time spent scanning in window up to now."""
+        running = now - self.window_start if self.window_start is not None else 0.0
+        return self.window_elapsed + running
+
+    def advance(self, now: Optional[float] = None) -> None:
+        """Move highlight to next group or item when dwell is up."""
+        if self.paused or not self.groups:
+            return
+        self.position += 1
+        self.highlighted_at = time.perf_counter() if now is None else now
+        if self.group is None and self.position >= len(self.groups):
+            self._next_cycle(self.highlighted_at)
+        elif self.group is not None and self.position >= len(self.groups[self.group]):
+            if len(self.groups) == 1:
+                self._next_cycle(self.highlighted_at)
+            else:
+                self.group = None
+                self.position = 0
+
+    def _next_cycle(self, now: float) -> None:
+        """Start over from first group, pausing after max cycles with no press, which stops window clock."""
+        self.position = 0
+        self.cycles += 1
+        self.paused = self.cycles >= SCAN_MAX_CYCLES
+        if self.paused:
+            self._stop_clock(now)
+
+    def press(self, now: Optional[float] = None) -> Optional[Any]:
+        """Switch press. Resumes if paused, else picks highlighted group, or returns highlighted item to act on.
+        Time since highlight is measured as reaction latency, unless too quick to be a reaction to it."""
+        now = time.perf_counter() if now is None else now
+        if self.paused:
+            self._restart(now)
+            return None
+        if not self.groups:
+            return None
+        self._measure((now - self.highlighted_at) * 1000)
+        if self.group is None:
+            self.group = self.position
+            self.position = 0
+            self.cycles = 0
+            self.highlighted_at = now
+            return None
+        return self.groups[self.group][self.position]
+
+    def _measure(self, latency_ms: float) -> None:
+        """Smooth reaction latency into running average."""
+        if latency_ms < SCAN_MIN_REACTION_MS:
+            return
+        if self.latency_ms is None:
+            self.latency_ms = latency_ms
+            return
+        self.latency_ms += SCAN_LATENCY_ALPHA * (latency_ms - self.latency_ms)
+
+    def record_chars(self, count: int = 1, now: Optional[float] = None) -> None:
+        """Count characters entered by scanning, tuning dwell once window is full."""
+        self.window_chars += count
+        if self.window_chars >= SCAN_WINDOW_CHARS:
+            self._tune(time.perf_counter() if now is None else now)
+
+    def record_error(self) -> None:
+        """Count character undone, it does not count toward throughput."""
+        self.window_errors += 1
+
+    def _tune(self, now: float) -> dict:
+        """End window, turning dwell change back if throughput fell, then step dwell and log window."""
+        minutes = self._window_seconds(now) / 60
+        cpm = max(self.window_chars - self.window_errors, 0) / minutes if minutes else 0.0
+        if self.last_cpm is not None and cpm < self.last_cpm:
+            self.direction = -self.direction
+        self.dwell_ms = self.dwell + self.direction * SCAN_STEP_MS
+        window = {
+            "time": time.time(),
+            "cpm": cpm,
+            "chars": self.window_chars,
+            "errors": self.window_errors,
+            "latency_ms": self.latency_ms,
+            "dwell_ms": self.dwell,
+        }
+        if self.log_path is not None:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, "a") as log_file:
+                log_file.write(json.dumps(window) + "\n")
+        self.last_cpm = cpm
+        self.window_elapsed = 0.0
+        if self.window_start is not None:
+            self.window_start = now
+        self.window_chars = 0
+        self.window_errors = 0
+        return window
@@ -0,0 +1,167 @@
+import argparse
+import gc
+import ipaddress
+import json
+import os
+import socketserver
+from pathlib import Path
+from typing import Optional, Union
+
+from communicate.communicator import Communicator
+from communicate.constants import SERVER_SOCKET
+from communicate.make_grid import make_grid
+
+# SERVER VALUES
+LOCAL_HOST: str = "localhost"
+SESSION_OPS: set[str] = {
+    "set_context",
+    "eval_grid",
+    "clear_grid",
+    "reduce_grid",
+    "page_grid",
+    "reset_grid",
+    "is_word",
+    "learn",
+    "use_profile",
+    "ranked_letters",
+}
+Address = Union[str, tuple[str, int]]
+
+
+def parse_address(address: str) -> Address:
+    """Host and port of host:port address, else path of Unix socket.
+    Server is only for terminals of this machine, so hosts other than localhost or a loopback address raise ValueError."""
+    host, sep, port = address.rpartition(":")
+    if not (sep and port.isdigit()):
+        return address
+    host = host or LOCAL_HOST
+    if host != LOCAL_HOST:
+        try:
+            loopback = ipaddress.ip_address(host).is_loopback
+        except ValueError:
+            loopback = False
+        if not loopback:
+            raise ValueError(f"{host} is not a local address, use localhost or a loopback address")
+    return host, int(port)
+
+
+def session_state(comms: Communicator) -> dict:
+    """Communicator state a thin client needs to show grid and suggestions after a call."""
+    return {
+        "remain_letters": comms.remain_letters,
+        "remain_grid": comms.remain_grid,
+        "suggestions": comms.suggestions,
+        "num_candidates": comms.num_candidates,
+        "include_empty": comms.include_empty,
+        "paged": comms.paged,
+    }
+
+
+def serve_request(comms: Communicator, request: dict) -> dict:
+    """Run one Communicator method of session for request, returning its result and session state after it.
+    Smart and chunks modes of client are applied first, since they are attributes client sets rather than calls."""
+    op = request.get("op")
+    if op not in SESSION_OPS:
+        raise ValueError(f"Unknown op {op}")
+    comms.smart = request.get("smart", comms.smart)
+    comms.chunks = request.get("chunks", comms.chunks)
+    result = getattr(comms, op)(*request.get("args", []))
+    return {"result": result, "state": session_state(comms)}
+
+
+class SessionHandler(socketserver.StreamRequestHandler):
+    """One connection is one terminal session, with own Communicator state sharing server's lexicon and index.
+    Requests and responses are one JSON object per line. Any error of a request is answered with its message
+    instead of result, so a malformed request never ends the session."""
+
+    def handle(self) -> None:
+        """Serve requests of connection until client closes it."""
+        comms = self.server.comms.new_session()  # type: ignore
+        for line in self.rfile:
+            try:
+                response = serve_request(comms, json.loads(line))
+            except Exception as e:
+                response = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class ForkingTCPServer(socketserver.ForkingTCPServer):
+    """TCP server forking process per session, rebinding address right after restart."""
+
+    allow_reuse_address = True
+
+
+class ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    """TCP server with thread per session, rebinding address right after restart. Threads don't keep server alive."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class ForkingUnixServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server forking process per session."""
+
+
+class ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server with thread per session. Threads don't keep server alive."""
+
+    daemon_threads = True
+
+
+def make_server(
+    address: Address, comms: Communicator, fork: bool = hasattr(os, "fork")
+) -> socketserver.BaseServer:
+    """Server of sessions sharing comms, on localhost TCP address or Unix socket path.
+
+    Forking gives each session own process copied on write from server, so lexicon and index built once are shared
+    and sessions run on separate cores. Without fork, sessions are threads of one process sharing same objects.
+    """
+    server: socketserver.BaseServer
+    if isinstance(address, tuple):
+        tcp_class = ForkingTCPServer if fork else ThreadingTCPServer
+        server = tcp_class(address, SessionHandler)
+    else:
+        unix_class = ForkingUnixServer if fork else ThreadingUnixServer
+        Path(address).unlink(missing_ok=True)
+        server = unix_class(address, SessionHandler)
+    server.comms = comms  # type: ignore
+    return server
+
+
+def serve(address: Address, smart: bool = True, fork: bool = hasattr(os, "fork")) -> None:
+    """Build Communicator once and serve sessions until interrupted.
+    Objects are frozen out of garbage collection before forking, so collection in sessions doesn't copy their pages."""
+    comms = Communicator(start_grid=make_grid(), smart=smart)
+    server = make_server(address, comms, fork)
+    if fork:
+        gc.freeze()
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    if not isinstance(address, tuple):
+        Path(address).unlink(missing_ok=True)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run prediction server from command line."""
+    parser = argparse.ArgumentParser(description="Serve Communicator sessions to local terminals")
+    parser.add_argument(
+        "--address",
+        default=str(SERVER_SOCKET),
+        help="Unix socket path or host:port for localhost TCP",
+    )
+    parser.add_argument("--custom", action="store_true", help="turn smart mode off")
+    parser.add_argument("--threads", action="store_true", help="thread per session instead of process")
+    args = parser.parse_args(argv)
+    try:
+        address = parse_address(args.address)
+    except ValueError as e:
+        parser.error(str(e))
+    serve(address, not args.custom, hasattr(os, "fork") and not args.threads)
+
+
+if __name__ == "__main__":
+    main()
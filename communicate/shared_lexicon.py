@@ -0,0 +1,38 @@
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from communicate.lexicon import Lexicon, load_lexicon
+from communicate.ngram import NgramModel, load_ngrams
+from communicate.prefix_index import PrefixIndex
+
+
+@dataclass(frozen=True)
+class SharedLexicon:
+    """Read only lexicon, prefix index over it and ngram model, built once per process and referenced by every Communicator,
+    so a second Communicator maps no file and builds no index. Prefix index only grows its nodes as they are walked into."""
+
+    lexicon: Lexicon
+    prefix_index: PrefixIndex
+    ngram_model: Optional[NgramModel]
+
+
+_shared: Optional[SharedLexicon] = None
+_lock = threading.Lock()
+
+
+def shared_lexicon() -> SharedLexicon:
+    """Process wide shared lexicon, built on first call. Lock is only taken until it is built,
+    and checked again under it so threads making Communicators at once still build it only once."""
+    global _shared
+    if _shared is None:
+        with _lock:
+            if _shared is None:
+                lexicon = load_lexicon()
+                prefix_index = PrefixIndex(lexicon)
+                _shared = SharedLexicon(
+                    lexicon=lexicon,
+                    prefix_index=prefix_index,
+                    ngram_model=load_ngrams(len(prefix_index.words)),
+                )
+    return _shared
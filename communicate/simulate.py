@@ -0,0 +1,292 @@
+import argparse
+import json
+from collections.abc import Sequence
+from typing import Optional
+
+import numpy as np
+
+from communicate.communicator import Communicator
+from communicate.constants import (
+    ALPHABET,
+    MAX_COLS,
+    MAX_ROWS,
+    OPTIMIZE_LAYOUT,
+    POINT_PAGE_SIZE,
+    SORT_LETTERS,
+)
+from communicate.layout import cell_order
+from communicate.letter_choice import LetterChoice
+from communicate.make_grid import make_grid
+
+# SIMULATE VALUES
+PAD: int = ord(ALPHABET[0]) - 1
+NUM_CODES: int = len(ALPHABET) + 1
+
+
+def letter_codes(words: Sequence[str]) -> np.ndarray:
+    """Words as rows of letter codes 1-26, padded with 0 to longest word."""
+    max_len = max(len(word) for word in words)
+    joined = "".join(word.ljust(max_len, chr(PAD)) for word in words)
+    codes = np.frombuffer(joined.encode("ascii"), dtype=np.uint8) - PAD
+    return codes.reshape(len(words), max_len).astype(np.int64)
+
+
+def letter_ranks(
+    letter_counts: np.ndarray, smart: bool, by_count: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rank of each letter in each prefix's ordered letters and number of letters left per prefix.
+
+    Letter counts is (prefixes, 27) next letter counts with column 0 unused. Smart keeps only letters with counts,
+    else all letters stay. Letters are alphabetical, or most common first if by count.
+    """
+    num_prefixes = letter_counts.shape[0]
+    available = letter_counts > 0
+    available[:, 0] = False
+    num_letters = (
+        available.sum(axis=1) if smart else np.full(num_prefixes, len(ALPHABET))
+    )
+    if by_count:
+        order = np.argsort(
+            -np.where(available, letter_counts, 0) + (np.arange(NUM_CODES) == 0),
+            axis=1,
+            kind="stable",
+        )
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(NUM_CODES)[None, :], axis=1)
+    elif smart:
+        ranks = np.cumsum(available, axis=1) - 1
+    else:
+        ranks = np.tile(np.arange(-1, len(ALPHABET)), (num_prefixes, 1))
+    return ranks, num_letters
+
+
+def reduced_dims(
+    num_letters: np.ndarray, optimize_layout: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rows and columns of reduced grid of each number of letters, like Communicator num_rows and num_cols."""
+    num_cols = np.minimum(np.ceil(np.sqrt(num_letters)), MAX_COLS).astype(np.int64)
+    if optimize_layout:
+        num_cols = np.where(num_letters <= MAX_COLS, num_letters, num_cols)
+    num_rows = np.minimum(np.ceil(num_letters / np.maximum(num_cols, 1)), MAX_ROWS)
+    return num_rows.astype(np.int64), num_cols
+
+
+def layout_cells(optimize_layout: bool) -> tuple[np.ndarray, np.ndarray]:
+    """Row and column of each rank in reduced grid of each number of letters, tables indexed [letters, rank]."""
+    num_letters = np.arange(NUM_CODES)
+    num_rows, num_cols = reduced_dims(num_letters, optimize_layout)
+    ranks = np.arange(NUM_CODES)
+    rows = ranks[None, :] // np.maximum(num_cols, 1)[:, None]
+    cols = ranks[None, :] % np.maximum(num_cols, 1)[:, None]
+    if optimize_layout:
+        for letters in range(1, NUM_CODES):
+            cells = np.array(cell_order(num_rows[letters], num_cols[letters]))
+            cells = cells[:NUM_CODES]
+            rows[letters, : len(cells)] = cells[:, 0]
+            cols[letters, : len(cells)] = cells[:, 1]
+    return rows, cols
+
+
+def scan_costs(
+    group_rows: np.ndarray,
+    count_ranks: np.ndarray,
+    available: np.ndarray,
+    row: np.ndarray,
+    count_rank: np.ndarray,
+) -> np.ndarray:
+    """Highlights Scan waits through to pick each letter, like scan_steps of scan_groups of reduced grid.
+
+    Group rows, count ranks and available are each picked letter's prefix's row in reduced grid, rank by count and
+    whether it is on grid, for every letter code. Rows are scanned from one holding likeliest letter,
+    letters in row from likeliest, and row is skipped if only one."""
+    in_row = available & (group_rows == row[:, None])
+    within = (in_row & (count_ranks < count_rank[:, None])).sum(axis=1)
+    row_firsts = np.stack(
+        [
+            np.where(available & (group_rows == grid_row), count_ranks, NUM_CODES).min(
+                axis=1
+            )
+            for grid_row in range(MAX_ROWS)
+        ],
+        axis=1,
+    )
+    own_first = np.where(in_row, count_ranks, NUM_CODES).min(axis=1)
+    num_rows = (row_firsts < NUM_CODES).sum(axis=1)
+    group_num = (row_firsts < own_first[:, None]).sum(axis=1)
+    return np.where(num_rows > 1, group_num + 1, 0) + within + 1
+
+
+def alphabet_cells(
+    codes: np.ndarray, weights: np.ndarray, optimize_layout: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row and column of each letter code in full grid cleared by Grid method, like Communicator alphabet grid."""
+    positions = np.arange(-1, len(ALPHABET))
+    if optimize_layout:
+        letter_count = np.bincount(
+            codes.ravel(),
+            weights=np.repeat(weights, codes.shape[1]),
+            minlength=NUM_CODES,
+        )
+        letter_count[0] = -1
+        order = np.argsort(-letter_count, kind="stable")
+        positions[order] = np.arange(NUM_CODES)
+        cells = np.array(cell_order(MAX_ROWS, MAX_COLS))
+        return cells[positions % len(cells), 0], cells[positions % len(cells), 1]
+    return positions // MAX_COLS, positions % MAX_COLS
+
+
+def simulate(
+    words: Sequence[str],
+    counts: Sequence[int],
+    smart: bool = True,
+    sort_letters: bool = SORT_LETTERS,
+    optimize_layout: bool = OPTIMIZE_LAYOUT,
+) -> dict:
+    """Selections every word needs with each method, computed one letter position at a time for all words at once.
+
+    Words must be alphabetically sorted so words of a prefix are contiguous and prefix groups are runs.
+    Letter picked at each position costs, given its cell in cleared grid or in reduced grid of letters left:
+    Grid a row and column, GridPoint a row only if reduced grid has more than one row then a column,
+    Point one flip per earlier page then a pick, pages holding page size letters from most to least common,
+    Scan the highlights it waits through on reduced grid. Pointing distance is row plus column of cell,
+    for Point the column on its page, for Scan its highlights. Word stops once one word is left or no letters are, like done in Communicator,
+    not counting a final done press. Verbal counts saying alphabet until each letter for comparison.
+    Averages are weighted by word counts.
+    """
+    codes = letter_codes(words)
+    weights = np.asarray(counts, dtype=np.float64)
+    lengths = (codes > 0).sum(axis=1)
+    num_words, max_len = codes.shape
+    layout_rows, layout_cols = layout_cells(optimize_layout)
+    grid_rows, grid_cols = alphabet_cells(codes, weights, optimize_layout)
+    active = np.ones(num_words, dtype=bool)
+    typed = np.zeros(num_words, dtype=np.int64)
+    costs = {
+        name: np.zeros(num_words, dtype=np.int64)
+        for name in (
+            "cols",
+            "grid_rows",
+            "grid_distance",
+            "gridpoint_rows",
+            "gridpoint_distance",
+            "pages",
+            "page_distance",
+            "scan",
+            "verbal",
+        )
+    }
+    boundary = np.zeros(num_words, dtype=bool)
+    boundary[0] = True
+    for depth in range(max_len):
+        group_ids = np.cumsum(boundary) - 1
+        num_groups = int(group_ids[-1]) + 1
+        continues = lengths > depth
+        letter = codes[:, depth]
+        letter_counts = np.bincount(
+            group_ids[continues] * NUM_CODES + letter[continues],
+            weights=weights[continues],
+            minlength=num_groups * NUM_CODES,
+        ).reshape(num_groups, NUM_CODES)
+        ranks, num_letters = letter_ranks(
+            letter_counts, smart, (smart and sort_letters) or optimize_layout
+        )
+        count_ranks, _ = letter_ranks(letter_counts, smart, True)
+        available = (
+            letter_counts > 0
+            if smart
+            else np.ones_like(letter_counts, dtype=bool)
+        )
+        available[:, 0] = False
+        picking = active & continues
+        picked = letter[picking]
+        rank = ranks[group_ids[picking], picked]
+        num_left = num_letters[group_ids[picking]]
+        num_rows, _ = reduced_dims(num_left, optimize_layout)
+        row = layout_rows[num_left, rank]
+        col = layout_cols[num_left, rank]
+        count_rank = count_ranks[group_ids[picking], picked]
+        picking_groups = group_ids[picking]
+        group_rows = layout_rows[
+            num_letters[picking_groups][:, None],
+            np.clip(ranks[picking_groups], 0, NUM_CODES - 1),
+        ]
+        costs["cols"][picking] += 1
+        costs["grid_rows"][picking] += 1
+        costs["grid_distance"][picking] += grid_rows[picked] + grid_cols[picked]
+        costs["gridpoint_rows"][picking] += (num_rows > 1).astype(np.int64)
+        costs["gridpoint_distance"][picking] += row + col
+        costs["pages"][picking] += count_rank // POINT_PAGE_SIZE + 1
+        costs["page_distance"][picking] += count_rank % POINT_PAGE_SIZE
+        costs["scan"][picking] += scan_costs(
+            group_rows,
+            count_ranks[picking_groups],
+            available[picking_groups],
+            row,
+            count_rank,
+        )
+        costs["verbal"][picking] += picked
+        typed[picking] += 1
+
+        boundary = boundary | np.concatenate(([True], letter[1:] != letter[:-1]))
+        next_ids = np.cumsum(boundary) - 1
+        group_size = np.bincount(next_ids)[next_ids]
+        longer = lengths > depth + 1
+        next_counts = np.bincount(
+            next_ids[longer] * NUM_CODES + codes[longer, min(depth + 1, max_len - 1)],
+            minlength=(int(next_ids[-1]) + 1) * NUM_CODES,
+        ).reshape(-1, NUM_CODES)
+        no_letters = (next_counts[:, 1:].sum(axis=1) == 0)[next_ids] & smart
+        active &= ~(continues & ((group_size == 1) | no_letters))
+    total = weights.sum()
+    report = {
+        "words": num_words,
+        "avg_letters_typed": float((typed * weights).sum() / total),
+        "avg_word_length": float((lengths * weights).sum() / total),
+    }
+    method_costs = {
+        LetterChoice.GRID.name: (
+            costs["grid_rows"] + costs["cols"],
+            costs["grid_distance"],
+        ),
+        LetterChoice.GRID_POINT.name: (
+            costs["gridpoint_rows"] + costs["cols"],
+            costs["gridpoint_distance"],
+        ),
+        LetterChoice.POINT.name: (costs["pages"], costs["page_distance"]),
+        LetterChoice.SCAN.name: (costs["scan"], costs["scan"]),
+        "VERBAL": (costs["verbal"], costs["verbal"]),
+    }
+    typed_total = (typed * weights).sum()
+    for name, (cost, distance) in method_costs.items():
+        report[name] = {
+            "avg_selections": float((cost * weights).sum() / total),
+            "avg_selections_unweighted": float(cost.mean()),
+            "avg_per_letter": float((cost * weights).sum() / typed_total),
+            "avg_distance_per_letter": float((distance * weights).sum() / typed_total),
+        }
+    return report
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Simulate selections of whole lexicon from command line, printing JSON report."""
+    parser = argparse.ArgumentParser(description="Selections per word for each method")
+    parser.add_argument("--custom", action="store_true", help="turn smart mode off")
+    parser.add_argument("--sort-letters", action="store_true", default=SORT_LETTERS)
+    parser.add_argument(
+        "--optimize-layout", action="store_true", default=OPTIMIZE_LAYOUT
+    )
+    args = parser.parse_args(argv)
+    comms = Communicator(start_grid=make_grid(), smart=not args.custom)
+    index = comms.prefix_index
+    report = simulate(
+        index.words,
+        index.counts,
+        comms.smart,
+        args.sort_letters,
+        args.optimize_layout,
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Callable, ContextManager, Iterator, Optional, TypeVar
+
+from communicate.constants import TRACE_ENV, TRACE_FORMAT_ENV
+
+# TRACE VALUES
+TRACE_WINDOW: int = 1000
+TRACE_EVENTS: int = 100_000
+HISTOGRAM_EDGES_MS: list[float] = [0.01, 0.1, 1.0, 10.0, 100.0]
+CHROME_FORMAT: str = "chrome"
+STATS_FORMAT: str = "stats"
+NULL_SPAN: ContextManager = nullcontext()
+
+Func = TypeVar("Func", bound=Callable)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest rank percentile of values, 0 if no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def histogram(durations_ms: list[float]) -> dict[str, int]:
+    """Count of durations in each bucket between histogram edges."""
+    buckets = [f"<{edge}ms" for edge in HISTOGRAM_EDGES_MS] + [
+        f">={HISTOGRAM_EDGES_MS[-1]}ms"
+    ]
+    counts = dict.fromkeys(buckets, 0)
+    for duration in durations_ms:
+        idx = next(
+            (
+                idx
+                for idx, edge in enumerate(HISTOGRAM_EDGES_MS)
+                if duration < edge
+            ),
+            len(HISTOGRAM_EDGES_MS),
+        )
+        counts[buckets[idx]] += 1
+    return counts
+
+
+@dataclass
+class Tracer:
+    """Opt in timer of each stage of a keystroke, from Communicator evaluation to GUI and CLI redraw.
+
+    Each span keeps its last window durations for rolling histograms and percentiles, and bounded events for Chrome trace.
+    Off, span just returns shared no-op context so instrumented code costs one attribute check.
+    """
+
+    enabled: bool = False
+    window: int = TRACE_WINDOW
+
+    def __post_init__(self) -> None:
+        """Empty rolling durations per span name and trace events, times relative to tracer creation."""
+        self.durations: dict[str, deque[float]] = {}
+        self.counts: dict[str, int] = {}
+        self.events: deque[dict] = deque(maxlen=TRACE_EVENTS)
+        self.origin: float = time.perf_counter()
+
+    def span(self, name: str) -> ContextManager:
+        """Context timing block as stage name, no-op if off."""
+        if not self.enabled:
+            return NULL_SPAN
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        """Time block and record its duration and trace event, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.record(name, start, end)
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """Add duration of stage between perf counter start and end."""
+        self.durations.setdefault(name, deque(maxlen=self.window)).append(end - start)
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.events.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": (start - self.origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+        )
+
+    def stats(self) -> dict[str, dict]:
+        """Per stage total count, and mean, p50, p99, max in milliseconds and histogram over rolling window."""
+        report = {}
+        for name, durations in list(self.durations.items()):
+            durations_ms = [duration * 1000 for duration in durations]
+            report[name] = {
+                "count": self.counts[name],
+                "mean_ms": sum(durations_ms) / len(durations_ms),
+                "p50_ms": percentile(durations_ms, 50),
+                "p99_ms": percentile(durations_ms, 99),
+                "max_ms": max(durations_ms),
+                "histogram": histogram(durations_ms),
+            }
+        return report
+
+    def chrome_trace(self) -> dict:
+        """Trace events in Chrome trace format, open in chrome://tracing or Perfetto."""
+        return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def export(self, path: Path, trace_format: str = STATS_FORMAT) -> Path:
+        """Write stats JSON or Chrome trace JSON to path."""
+        data = self.chrome_trace() if trace_format == CHROME_FORMAT else self.stats()
+        path.write_text(json.dumps(data, indent=2))
+        return path
+
+
+def tracer_from_env() -> Tracer:
+    """Tracer turned on if trace env var names an output path, exported there at exit in format of format env var."""
+    path: Optional[str] = os.environ.get(TRACE_ENV)
+    tracer = Tracer(enabled=bool(path))
+    if path:
+        atexit.register(
+            tracer.export, Path(path), os.environ.get(TRACE_FORMAT_ENV, STATS_FORMAT)
+        )
+    return tracer
+
+
+TRACER: Tracer = tracer_from_env()
+
+
+def traced(name: str) -> Callable[[Func], Func]:
+    """Decorator timing each call of function as stage name when tracing is on, else only checks flag."""
+
+    def decorate(func: Func) -> Func:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with TRACER.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorate
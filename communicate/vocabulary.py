@@ -0,0 +1,197 @@
+import fcntl
+import re
+import time
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import count
+from pathlib import Path
+from typing import Iterator, Optional
+
+from communicate.constants import (
+    ALPHABET,
+    BLANK,
+    PROFILE_DIR,
+    VOCAB_COMPACT_EVERY,
+    VOCAB_HALF_LIFE_DAYS,
+    VOCAB_MIN_USES,
+    VOCAB_USE_COUNT,
+)
+from communicate.lexicon import PREFIX_END, Lexicon, write_lexicon
+
+# VOCABULARY VALUES
+LOG_NAME: str = "vocabulary.log"
+LOCK_NAME: str = "vocabulary.lock"
+SNAPSHOT_GLOB: str = "vocabulary-*.bin"
+SNAPSHOT_TAG: str = "#snapshot"
+SNAPSHOT_SCALE: int = 1000
+SECONDS_PER_DAY: int = 86400
+# Profile names are directory names under profiles directory, so no separators or dots that could leave it
+PROFILE_PATTERN: re.Pattern = re.compile(r"[A-Za-z0-9_-]+")
+
+# Version of every vocabulary change in this process, so grids ranked with different vocabularies never share cache key
+_versions = count(1)
+
+
+def profile_path(profile: str, directory: Path = PROFILE_DIR) -> Path:
+    """Directory of profile under directory, ValueError if name is not only letters, digits, _ and -."""
+    if not PROFILE_PATTERN.fullmatch(profile):
+        raise ValueError(
+            f"Profile name {profile!r} can only have letters, digits, _ and -"
+        )
+    return directory / profile
+
+
+@dataclass
+class Vocabulary:
+    """Words one user profile committed, kept in append only log and ranked with recency decay,
+    so names of family, medications and staff rank like common words while used and fade once not.
+
+    Each use adds weight that halves every half life. Weights are relative to epoch of last compaction,
+    so a use only adds to its own word while every word decays together. Compaction folds log into
+    compiled lexicon file of profile and starts log over from it, dropping words that faded out.
+    Sessions of one profile in other processes share its log, so appending and compacting hold a lock on profile.
+    """
+
+    profile: str
+    directory: Path = PROFILE_DIR
+    half_life_days: float = VOCAB_HALF_LIFE_DAYS
+
+    def __post_init__(self) -> None:
+        """Load profile from its snapshot and log, compacting it if log grew past limit."""
+        self.path: Path = profile_path(self.profile, self.directory)
+        self.log_path: Path = self.path / LOG_NAME
+        self.epoch: float = time.time()
+        self.weights: dict[str, float] = {}
+        self.words: list[str] = []
+        self.counts: dict[str, int] = {}
+        self.entries: int = 0
+        self.version: int = 0
+        with self._locked():
+            self._load()
+            if self.entries > VOCAB_COMPACT_EVERY:
+                self._compact()
+        self._update_counts()
+
+    def __contains__(self, word: str) -> bool:
+        """Whether word was used recently enough to still count."""
+        return self.counts.get(word, 0) > 0
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold lock on profile for block, so only one process at a time appends to or compacts its log."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.path / LOCK_NAME, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> None:
+        """Read snapshot named by log header, then replay uses logged after it.
+        Last line is skipped if a crash cut it short. Snapshot is closed once read, so compaction can remove it."""
+        self.epoch = time.time()
+        self.weights = {}
+        self.words = []
+        self.entries = 0
+        if not self.log_path.exists():
+            return
+        with open(self.log_path) as log_file:
+            for line in log_file:
+                fields = line.split()
+                if not line.endswith("\n"):
+                    break
+                if len(fields) == 3 and fields[0] == SNAPSHOT_TAG:
+                    if not (self.path / fields[2]).exists():
+                        continue
+                    self.epoch = float(fields[1])
+                    with Lexicon(self.path / fields[2]) as snapshot:
+                        self.weights = {
+                            word: uses / SNAPSHOT_SCALE
+                            for word, uses in snapshot.items()
+                        }
+                    self.words = sorted(self.weights)
+                elif len(fields) == 2:
+                    self._add(fields[1], float(fields[0]))
+                    self.entries += 1
+
+    def _decay(self, now: float) -> float:
+        """Factor taking weights relative to epoch to uses at now."""
+        return 2 ** (-(now - self.epoch) / (self.half_life_days * SECONDS_PER_DAY))
+
+    def _add(self, word: str, when: float) -> None:
+        """Add one use of word at time when."""
+        if word not in self.weights:
+            insort(self.words, word)
+        self.weights[word] = self.weights.get(word, 0.0) + 1 / self._decay(when)
+
+    def _update_counts(self, now: Optional[float] = None) -> None:
+        """Count each word is worth at now, a fresh use worth use count like that many corpus uses. New version."""
+        factor = self._decay(time.time() if now is None else now)
+        self.counts = {
+            word: round(VOCAB_USE_COUNT * weight * factor)
+            for word, weight in self.weights.items()
+        }
+        self.version = next(_versions)
+
+    def record(self, word: str, when: Optional[float] = None) -> bool:
+        """Append committed word to log and add its use, compacting every so many uses.
+        Words with letters not in alphabet are not recorded, returns whether word was."""
+        word = word.lower()
+        if not word or not set(word) <= set(ALPHABET):
+            return False
+        when = time.time() if when is None else when
+        with self._locked():
+            with open(self.log_path, "a") as log_file:
+                log_file.write(f"{when}\t{word}\n")
+            self._add(word, when)
+            self.entries += 1
+            if self.entries > VOCAB_COMPACT_EVERY:
+                self._compact(when)
+        self._update_counts(when)
+        return True
+
+    def compact(self, now: Optional[float] = None) -> None:
+        """Fold uses at now into compiled lexicon of profile and start log over from it, so loading maps one file
+        and replays a short log. Words that faded below min uses are dropped."""
+        with self._locked():
+            self._compact(now)
+        self._update_counts(now)
+
+    def _compact(self, now: Optional[float] = None) -> None:
+        """Compact while holding lock. Log is read again first, so uses other sessions of profile logged are kept.
+        New log only replaces old one once its snapshot is written, so a crash leaves old snapshot and log in place."""
+        now = time.time() if now is None else now
+        self._load()
+        factor = self._decay(now)
+        uses = {
+            word: round(weight * factor * SNAPSHOT_SCALE)
+            for word, weight in self.weights.items()
+            if weight * factor >= VOCAB_MIN_USES
+        }
+        snapshot_name = f"vocabulary-{int(now * 1000)}.bin"
+        header = BLANK
+        if uses:
+            write_lexicon(self.path / snapshot_name, uses)
+            header = f"{SNAPSHOT_TAG}\t{now}\t{snapshot_name}\n"
+        tmp_path = self.log_path.with_suffix(".tmp")
+        tmp_path.write_text(header)
+        tmp_path.replace(self.log_path)
+        for old_path in self.path.glob(SNAPSHOT_GLOB):
+            if old_path.name != snapshot_name:
+                old_path.unlink(missing_ok=True)
+        self.epoch = now
+        self.weights = {word: scaled / SNAPSHOT_SCALE for word, scaled in uses.items()}
+        self.words = sorted(self.weights)
+        self.entries = 0
+
+    def completions(self, prefix: str) -> list[tuple[str, int]]:
+        """Words still counting that start with prefix with their counts, alphabetical."""
+        start = bisect_left(self.words, prefix)
+        end = bisect_left(self.words, prefix + PREFIX_END, start)
+        return [
+            (word, self.counts[word])
+            for word in self.words[start:end]
+            if self.counts[word] > 0
+        ]
@@ -6,5 +6,8 @@ setup(
     description="Communication Helper and Interface",
     author="Joseh Palombo",
     packages=["communicate"],
+    package_data={"communicate": ["data/*.bin"]},
     setup_requires=["nltk"],
+    extras_require={"bench": ["numpy"]},
+    entry_points={"console_scripts": ["communicate=communicate.entry:main"]},
 )
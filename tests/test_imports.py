@@ -0,0 +1,16 @@
+from communicate.bench import IMPORT_FORBIDDEN, check_imports, measure_imports
+
+# Cold imports are timed a few times and the fastest kept, so one slow start of a busy machine doesn't fail the run
+RUNS: int = 3
+
+
+def test_cli_import_heavy_modules():
+    """Console entry point and CLI never pull in GUI, NumPy or nltk."""
+    imports = measure_imports()
+    assert not set(imports["heavy_modules"]) & set(IMPORT_FORBIDDEN), check_imports(imports)
+
+
+def test_cli_import_budget():
+    """Cold import of console entry point and CLI stays in its millisecond budget."""
+    imports = min((measure_imports() for _ in range(RUNS)), key=lambda run: run["import_ms"])
+    assert check_imports(imports) is None, check_imports(imports)